@@ -11,8 +11,18 @@ class Settings(BaseSettings):
     supabase_url: str
     supabase_anon_key: str
     supabase_service_role_key: str
+    # Point database_url at the Supavisor transaction-mode port (6543) so
+    # many logical connections multiplex onto few Postgres backends
     database_url: str
 
+    # HTTP connection pool limits for the shared PostgREST session
+    db_max_connections: int = 20
+    db_max_keepalive_connections: int = 10
+
+    # asyncpg pool size for direct Postgres access on hot paths
+    pg_pool_min_size: int = 2
+    pg_pool_max_size: int = 10
+
     # Redis Configuration
     upstash_redis_rest_url: str
     upstash_redis_rest_token: str
@@ -1,24 +1,103 @@
 """Database connection and utilities."""
+import json
+from typing import Optional
+import asyncpg
+import httpx
 from supabase import create_client, Client
 from functools import lru_cache
 from app.config import get_settings
 
 settings = get_settings()
 
+# Shared asyncpg pool for hot read paths that bypass PostgREST
+_pg_pool: Optional[asyncpg.Pool] = None
+
+
+async def _init_pg_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects on every pool connection."""
+    for type_name in ('json', 'jsonb'):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema='pg_catalog'
+        )
+
+
+async def init_pg_pool() -> asyncpg.Pool:
+    """
+    Create the shared asyncpg connection pool (called on app startup).
+
+    Talks the Postgres binary protocol directly, so hot endpoints avoid
+    PostgREST's per-request HTTP + JSON overhead and get prepared-statement
+    caching per connection for free.
+    """
+    global _pg_pool
+    if _pg_pool is None:
+        _pg_pool = await asyncpg.create_pool(
+            dsn=settings.database_url,
+            min_size=settings.pg_pool_min_size,
+            max_size=settings.pg_pool_max_size,
+            init=_init_pg_connection
+        )
+    return _pg_pool
+
+
+def get_pg_pool() -> asyncpg.Pool:
+    """Get the shared asyncpg pool (init_pg_pool must have run)."""
+    if _pg_pool is None:
+        raise RuntimeError("asyncpg pool not initialized; app startup has not run")
+    return _pg_pool
+
+
+async def close_pg_pool() -> None:
+    """Close the shared asyncpg pool (called on app shutdown)."""
+    global _pg_pool
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
+
 
 @lru_cache()
 def get_supabase_client() -> Client:
     """
     Get cached Supabase client instance.
 
+    The underlying PostgREST session is replaced with an httpx client with
+    explicit connection limits so concurrent requests reuse a bounded pool
+    of keep-alive TCP connections instead of opening new ones (and paying
+    TLS handshakes) under load.
+
     Returns:
         Client: Supabase client configured with service role key
     """
-    return create_client(
+    client = create_client(
         settings.supabase_url,
         settings.supabase_service_role_key
     )
 
+    # Swap in a session with explicit pool limits, preserving the
+    # base URL, auth headers and timeout PostgREST configured
+    session = client.postgrest.session
+    client.postgrest.session = httpx.Client(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        limits=httpx.Limits(
+            max_connections=settings.db_max_connections,
+            max_keepalive_connections=settings.db_max_keepalive_connections
+        )
+    )
+
+    return client
+
+
+def close_supabase_client() -> None:
+    """Close the shared PostgREST session (called on app shutdown)."""
+    if get_supabase_client.cache_info().currsize:
+        get_supabase_client().postgrest.session.close()
+        get_supabase_client.cache_clear()
+
 
 def get_db() -> Client:
     """
@@ -4,9 +4,13 @@ DEI Tracker API - Main Application
 Comprehensive API for tracking corporate DEI (Diversity, Equity, and Inclusion)
 stances, commitments, and actions over time.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import get_settings
+from app.database import close_supabase_client, init_pg_pool, close_pg_pool
+from app.utils.fetch_title import close_fetch_client
 from app.routers import (
     companies,
     profiles,
@@ -22,6 +26,17 @@ from app.redis_client import redis_client, clear_cache_pattern
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage shared connection resources for the app's lifetime."""
+    await init_pg_pool()
+    yield
+    await close_fetch_client()
+    await close_pg_pool()
+    close_supabase_client()
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title=settings.app_name,
@@ -29,7 +44,11 @@ app = FastAPI(
     description=settings.app_description,
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    # orjson serializes large nested payloads (e.g. full profiles) much faster
+    # than stdlib json and handles UUIDs/datetimes natively
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
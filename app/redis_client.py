@@ -1,5 +1,5 @@
 """Redis client configuration and utilities."""
-import json
+import orjson
 from typing import Optional, Any
 from upstash_redis import Redis
 from app.config import get_settings
@@ -34,8 +34,8 @@ async def get_cache(key: str) -> Optional[Any]:
             # Upstash Redis returns strings, parse JSON if needed
             if isinstance(value, str):
                 try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
                     return value
             return value
     except Exception as e:
@@ -43,6 +43,35 @@ async def get_cache(key: str) -> Optional[Any]:
         return None
 
 
+async def get_cache_many(keys: list) -> list:
+    """
+    Get multiple values from Redis cache in one round-trip.
+
+    Args:
+        keys: Cache keys to look up
+
+    Returns:
+        List of cached values aligned with keys; None for misses
+    """
+    if not keys:
+        return []
+    try:
+        values = redis_client.mget(*keys)
+    except Exception as e:
+        print(f"Redis MGET error: {e}")
+        return [None] * len(keys)
+
+    results = []
+    for value in values:
+        if isinstance(value, str):
+            try:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+        results.append(value)
+    return results
+
+
 async def set_cache(key: str, value: Any, ttl: Optional[int] = None) -> bool:
     """
     Set value in Redis cache with optional TTL.
@@ -58,9 +87,10 @@ async def set_cache(key: str, value: Any, ttl: Optional[int] = None) -> bool:
     try:
         ttl = ttl or settings.redis_cache_ttl
 
-        # Serialize value to JSON
+        # Serialize value to JSON; orjson is several times faster than
+        # stdlib json and handles datetimes/UUIDs natively
         if not isinstance(value, str):
-            value = json.dumps(value)
+            value = orjson.dumps(value).decode()
 
         redis_client.set(key, value, ex=ttl)
         return True
@@ -1,4 +1,5 @@
 """Analytics and aggregation API endpoints."""
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Depends, Security
 from typing import List, Optional
 from datetime import datetime
@@ -18,6 +19,17 @@ from app.utils.cache import cached, build_query_cache_key
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
+async def _execute_all(*queries):
+    """
+    Execute independent PostgREST queries concurrently.
+
+    The sync supabase client serializes round-trips; running each
+    execute on a worker thread overlaps the network latency, so N
+    queries cost roughly one RTT instead of N.
+    """
+    return await asyncio.gather(*(asyncio.to_thread(q.execute) for q in queries))
+
+
 @router.get("/overview", response_model=dict)
 @cached("analytics:overview", ttl=600, key_builder=lambda db, key_validation: "analytics:overview")  # Cache for 10 minutes
 async def get_overview_stats(
@@ -32,54 +44,66 @@ async def get_overview_stats(
 
     Results are cached for 10 minutes.
     """
-    # Get basic counts
-    companies_result = db.table('companies').select('id', count='exact').execute()
-    profiles_result = db.table('profiles').select('id', count='exact').execute()
-    sources_result = db.table('data_sources').select('id, source_type', count='exact').execute()
-    commitments_result = db.table('commitments').select('id, current_status', count='exact').execute()
-    controversies_result = db.table('controversies').select('id', count='exact').execute()
-    events_result = db.table('events').select('id', count='exact').execute()
+    # All component queries are independent, so they run concurrently.
+    # Pure-count queries use head=True so only the count header comes
+    # back, and breakdown queries ship one column
+    (
+        companies_result,
+        profiles_result,
+        breakdowns_result,
+        controversies_result,
+        events_result,
+        dims_result,
+        risk_result,
+        recommendation_result,
+        dei_status_result,
+        transparency_result,
+        latest_profile,
+    ) = await _execute_all(
+        db.table('companies').select('id', count='exact', head=True),
+        db.table('profiles').select('id', count='exact', head=True),
+        # Source/commitment totals and breakdowns grouped server-side
+        # by overview_breakdowns() (migrations/018)
+        db.rpc('overview_breakdowns'),
+        db.table('controversies').select('id', count='exact', head=True),
+        db.table('events').select('id', count='exact', head=True),
+        # Unique industry/country counts, computed server-side in one
+        # scan by dei_overview_dims() (migrations/009)
+        db.rpc('dei_overview_dims'),
+        db.table('risk_assessments').select('risk_level'),
+        db.table('profiles_full').select('recommendation').eq('is_latest', True),
+        db.table('profiles_full').select('dei_status').eq('is_latest', True),
+        db.table('profiles_full').select('transparency_rating').eq('is_latest', True),
+        db.table('profiles').select('research_captured_at').order('research_captured_at', desc=True).limit(1),
+    )
 
     total_companies = companies_result.count if hasattr(companies_result, 'count') else len(companies_result.data)
     total_profiles = profiles_result.count if hasattr(profiles_result, 'count') else len(profiles_result.data)
-    total_sources = sources_result.count if hasattr(sources_result, 'count') else len(sources_result.data)
-    total_commitments = commitments_result.count if hasattr(commitments_result, 'count') else len(commitments_result.data)
     total_controversies = controversies_result.count if hasattr(controversies_result, 'count') else len(controversies_result.data)
     total_events = events_result.count if hasattr(events_result, 'count') else len(events_result.data)
 
+    breakdowns = breakdowns_result.data[0] if breakdowns_result.data else {}
+    total_sources = breakdowns.get('total_sources') or 0
+    total_commitments = breakdowns.get('total_commitments') or 0
+
     # Calculate averages
     avg_sources_per_company = round(total_sources / total_companies, 1) if total_companies > 0 else 0
     avg_commitments_per_company = round(total_commitments / total_companies, 1) if total_companies > 0 else 0
 
-    # Get unique industries and countries
-    companies_data = db.table('companies').select('industry, hq_country').execute()
-    industries = set(c['industry'] for c in companies_data.data if c.get('industry'))
-    countries = set(c['hq_country'] for c in companies_data.data if c.get('hq_country'))
+    dims = dims_result.data[0] if dims_result.data else {}
 
-    # Source type breakdown
-    source_type_breakdown = {}
-    for source in sources_result.data:
-        stype = source.get('source_type', 'unknown')
-        source_type_breakdown[stype] = source_type_breakdown.get(stype, 0) + 1
-
-    # Commitment status breakdown
-    commitment_status_breakdown = {}
-    for commitment in commitments_result.data:
-        status = commitment.get('current_status', 'unknown')
-        commitment_status_breakdown[status] = commitment_status_breakdown.get(status, 0) + 1
+    # Source type / commitment status breakdowns arrive pre-grouped as
+    # jsonb objects
+    source_type_breakdown = breakdowns.get('source_types') or {}
+    commitment_status_breakdown = breakdowns.get('commitment_statuses') or {}
 
     # Risk level breakdown
-    risk_result = db.table('risk_assessments').select('risk_level').execute()
     risk_level_breakdown = {}
     for risk in risk_result.data:
         level = risk.get('risk_level', 'unknown')
         risk_level_breakdown[level] = risk_level_breakdown.get(level, 0) + 1
 
     # AI Recommendation (Grade) breakdown - from latest profiles only
-    recommendation_result = db.table('profiles_full') \
-        .select('recommendation') \
-        .eq('is_latest', True) \
-        .execute()
     recommendation_breakdown = {}
     for rec in recommendation_result.data:
         recommendation = rec.get('recommendation', 'unknown')
@@ -87,10 +111,6 @@ async def get_overview_stats(
             recommendation_breakdown[recommendation] = recommendation_breakdown.get(recommendation, 0) + 1
 
     # DEI Status breakdown - from latest profiles only
-    dei_status_result = db.table('profiles_full') \
-        .select('dei_status') \
-        .eq('is_latest', True) \
-        .execute()
     dei_status_breakdown = {}
     for status in dei_status_result.data:
         dei_stat = status.get('dei_status', 'unknown')
@@ -98,10 +118,6 @@ async def get_overview_stats(
             dei_status_breakdown[dei_stat] = dei_status_breakdown.get(dei_stat, 0) + 1
 
     # Transparency Rating distribution - from latest profiles only
-    transparency_result = db.table('profiles_full') \
-        .select('transparency_rating') \
-        .eq('is_latest', True) \
-        .execute()
     transparency_distribution = {}
     for transp in transparency_result.data:
         rating = transp.get('transparency_rating')
@@ -116,12 +132,6 @@ async def get_overview_stats(
             transparency_distribution[range_key] = transparency_distribution.get(range_key, 0) + 1
 
     # Get latest research date
-    latest_profile = db.table('profiles') \
-        .select('research_captured_at') \
-        .order('research_captured_at', desc=True) \
-        .limit(1) \
-        .execute()
-
     latest_research_date = None
     if latest_profile.data and latest_profile.data[0].get('research_captured_at'):
         latest_research_date = latest_profile.data[0]['research_captured_at']
@@ -136,8 +146,8 @@ async def get_overview_stats(
             "total_events": total_events,
             "avg_sources_per_company": avg_sources_per_company,
             "avg_commitments_per_company": avg_commitments_per_company,
-            "industries_covered": len(industries),
-            "countries_covered": len(countries),
+            "industries_covered": dims.get('industries', 0),
+            "countries_covered": dims.get('countries', 0),
             "latest_research_date": latest_research_date,
             "source_type_breakdown": source_type_breakdown,
             "commitment_status_breakdown": commitment_status_breakdown,
@@ -163,97 +173,24 @@ async def get_industry_stats(
 
     Results are cached for 10 minutes.
     """
-    # Get all companies
-    companies = db.table('companies') \
-        .select('id, industry') \
-        .execute()
-
-    # Get latest profile data for each company from profiles_full
-    profiles_full = db.table('profiles_full') \
-        .select('company_id, profile_id, source_count, cdo_exists') \
-        .eq('is_latest', True) \
-        .execute()
-
-    # Get all commitments
-    commitments = db.table('commitments') \
-        .select('profile_id, current_status') \
-        .execute()
-
-    # Get all controversies
-    controversies = db.table('controversies') \
-        .select('profile_id') \
-        .execute()
-
-    # Build lookup dictionaries
-    profile_full_by_company = {p['company_id']: p for p in profiles_full.data}
-
-    # Count commitments by profile_id
-    commitments_by_profile = {}
-    active_commitments_by_profile = {}
-    for c in commitments.data:
-        profile_id = c['profile_id']
-        commitments_by_profile[profile_id] = commitments_by_profile.get(profile_id, 0) + 1
-        if c.get('current_status') == 'active':
-            active_commitments_by_profile[profile_id] = active_commitments_by_profile.get(profile_id, 0) + 1
-
-    # Count controversies by profile_id
-    controversies_by_profile = {}
-    for c in controversies.data:
-        profile_id = c['profile_id']
-        controversies_by_profile[profile_id] = controversies_by_profile.get(profile_id, 0) + 1
-
-    # Group by industry
-    industry_data = {}
-    for company in companies.data:
-        industry = company.get('industry', 'Unknown')
-        if industry not in industry_data:
-            industry_data[industry] = {
-                'industry': industry,
-                'company_count': 0,
-                'total_sources': 0,
-                'total_commitments': 0,
-                'active_commitments': 0,
-                'total_controversies': 0,
-                'companies_with_cdo': 0
-            }
-
-        industry_data[industry]['company_count'] += 1
-
-        company_id = company['id']
-
-        # Get profile_full data
-        profile_full = profile_full_by_company.get(company_id)
-        if profile_full:
-            profile_id = profile_full.get('profile_id')
-
-            industry_data[industry]['total_sources'] += profile_full.get('source_count', 0)
-
-            # Count commitments for this profile
-            total_commits = commitments_by_profile.get(profile_id, 0)
-            active_commits = active_commitments_by_profile.get(profile_id, 0)
-            industry_data[industry]['total_commitments'] += total_commits
-            industry_data[industry]['active_commitments'] += active_commits
-
-            # Count controversies for this profile
-            total_controv = controversies_by_profile.get(profile_id, 0)
-            industry_data[industry]['total_controversies'] += total_controv
-
-            if profile_full.get('cdo_exists'):
-                industry_data[industry]['companies_with_cdo'] += 1
+    # One grouped query server-side: industry_stats() (migrations/010)
+    # joins companies to their latest profile and returns one row per
+    # industry, so only K aggregate rows cross the network
+    stats_result = db.rpc('industry_stats').execute()
 
     # Calculate averages and format results
     results = []
-    for industry, data in industry_data.items():
-        count = data['company_count']
+    for row in stats_result.data:
+        count = row['company_count']
         results.append({
-            'industry': industry,
+            'industry': row['industry'],
             'company_count': count,
-            'avg_sources': round(data['total_sources'] / count, 1) if count > 0 else 0,
-            'avg_commitments': round(data['total_commitments'] / count, 1) if count > 0 else 0,
-            'total_commitments': data['total_commitments'],
-            'active_commitments': data['active_commitments'],
-            'total_controversies': data['total_controversies'],
-            'companies_with_cdo': data['companies_with_cdo']
+            'avg_sources': round(row['total_sources'] / count, 1) if count > 0 else 0,
+            'avg_commitments': round(row['total_commitments'] / count, 1) if count > 0 else 0,
+            'total_commitments': row['total_commitments'],
+            'active_commitments': row['active_commitments'],
+            'total_controversies': row['total_controversies'],
+            'companies_with_cdo': row['companies_with_cdo']
         })
 
     # Sort by company count descending
@@ -291,11 +228,9 @@ async def compare_companies(
             detail="Maximum 5 companies allowed for comparison"
         )
 
-    comparisons = []
-
-    for company_id in company_ids:
-        # Get company with full data
-        company_result = db.table('companies') \
+    # One embedded query per company, fired concurrently
+    company_results = await _execute_all(*(
+        db.table('companies')
             .select('''
                 id,
                 name,
@@ -313,11 +248,15 @@ async def compare_companies(
                     risk_assessments(overall_risk_score, risk_level),
                     ai_contexts(commitment_strength_rating, transparency_rating, recommendation)
                 )
-            ''') \
-            .eq('id', company_id) \
-            .limit(1) \
-            .execute()
+            ''')
+            .eq('id', company_id)
+            .limit(1)
+        for company_id in company_ids
+    ))
+
+    comparisons = []
 
+    for company_result in company_results:
         if not company_result.data:
             continue
 
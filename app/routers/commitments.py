@@ -1,36 +1,50 @@
 """Commitments API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, Request, Response
 from typing import Optional
 from supabase import Client
 from app.database import get_db
-from app.schemas import Commitment, CommitmentWithCompany, PaginationMeta
+from app.schemas import Commitment, CommitmentWithCompany, CommitmentType, CommitmentStatus, PaginationMeta
 from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
 from app.utils.cache import cached
+from app.utils.etag import conditional
+from app.utils.postgrest import quote_filter_value
 
 router = APIRouter(prefix="/commitments", tags=["commitments"])
 
 
 @router.get("/", response_model=dict)
+@conditional
 @cached("commitments:list", ttl=300)
 async def list_commitments(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     profile_id: Optional[str] = Query(None, description="Filter by profile ID"),
     company_id: Optional[str] = Query(None, description="Filter by company ID"),
-    commitment_type: Optional[str] = Query(None, description="Filter by type (pledge, industry_initiative)"),
-    status: Optional[str] = Query(None, description="Filter by status (active, completed, discontinued)"),
+    commitment_type: Optional[CommitmentType] = Query(None, description="Filter by type (pledge, industry_initiative)"),
+    status: Optional[CommitmentStatus] = Query(None, description="Filter by status (active, completed, discontinued)"),
     search: Optional[str] = Query(None, description="Search in commitment name"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
+    after_name: Optional[str] = Query(None, description="Keyset cursor: commitment_name of the last row on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last row on the previous page"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
     """
     List all DEI commitments and initiatives with filtering.
+
+    Pass the next_cursor values (after_name, after_id) from a previous
+    response for keyset pagination, which stays fast on deep pages where
+    OFFSET degrades linearly.
     """
     offset = (page - 1) * per_page
 
-    # Build query
-    query = db.table('commitments').select(
+    # Build query against the pre-joined view (migrations/023), whose
+    # rows already carry the company object in the response shape
+    query = db.table('commitments_with_company').select(
         '''
         id,
         profile_id,
@@ -39,36 +53,57 @@ async def list_commitments(
         current_status,
         status_changed_at,
         previous_status,
-        quotes,
-        provenance_ids,
-        profiles!inner(
-            id,
-            company_id,
-            companies!inner(id, name, ticker, industry)
-        )
+        quote_count,
+        source_count,
+        company
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # Apply filters
     if profile_id:
         query = query.eq('profile_id', profile_id)
     if commitment_type:
-        query = query.eq('commitment_type', commitment_type)
+        query = query.eq('commitment_type', commitment_type.value)
     if status:
-        query = query.eq('current_status', status)
+        query = query.eq('current_status', status.value)
     if search:
         query = query.ilike('commitment_name', f'%{search}%')
     if company_id:
-        query = query.eq('profiles.company_id', company_id)
-
-    # Get total count
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
+        query = query.eq('company_id', company_id)
 
-    # Apply pagination
-    query = query.range(offset, offset + per_page - 1)
+    # Apply pagination and execute once; PostgREST returns the total
+    # count alongside the page when the select is count-enabled
+    if after_name:
+        # Keyset pagination on (commitment_name, id): every page is an
+        # index range scan from the cursor, so deep pages cost the same
+        # as page one
+        if after_id:
+            # Commitment names come back verbatim in next_cursor and can
+            # contain or=() syntax characters, so quote them as literals
+            cursor_name = quote_filter_value(after_name)
+            query = query.or_(
+                f"commitment_name.gt.{cursor_name},"
+                f"and(commitment_name.eq.{cursor_name},id.gt.{after_id})"
+            )
+        else:
+            query = query.gt('commitment_name', after_name)
+        query = query.order('commitment_name').order('id').limit(per_page)
+    else:
+        query = query.range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count or 0
+
+    # A full page may have a successor; its last row is the next cursor
+    next_cursor = None
+    if len(result.data) == per_page:
+        last = result.data[-1]
+        next_cursor = {
+            "after_name": last['commitment_name'],
+            "after_id": last['id']
+        }
 
     # Calculate pagination
     total_pages = (total_count + per_page - 1) // per_page
@@ -80,24 +115,91 @@ async def list_commitments(
         has_next=page < total_pages,
         has_prev=page > 1,
         next_page=page + 1 if page < total_pages else None,
-        prev_page=page - 1 if page > 1 else None
+        prev_page=page - 1 if page > 1 else None,
+        next_cursor=next_cursor
+    )
+
+    return {
+        "data": result.data,
+        "pagination": pagination
+    }
+
+
+@router.get("/batch", response_model=dict)
+@cached("commitments:batch", ttl=300)
+async def get_commitments_batch(
+    ids: str = Query(..., description="Comma-separated commitment IDs (max 100)"),
+    db: Client = Depends(get_db),
+    key_validation: APIKeyValidation = Security(verify_api_key)
+):
+    """
+    Get multiple commitments with their sources in a single call.
+
+    Callers walking a list page previously hit the detail endpoint once
+    per commitment (two queries each). This resolves any number of
+    commitments with exactly two IN-list queries: one for the
+    commitments with their company, one against the junction table for
+    every commitment's sources.
+    """
+    commitment_ids = [cid.strip() for cid in ids.split(',') if cid.strip()]
+
+    if not commitment_ids:
+        raise HTTPException(status_code=400, detail="At least one commitment ID required")
+    if len(commitment_ids) > 100:
+        raise HTTPException(status_code=400, detail="Maximum 100 commitments per batch")
+
+    commitments_query = db.table('commitments') \
+        .select('''
+            *,
+            profiles!inner(
+                id,
+                company_id,
+                companies!inner(id, name, ticker, industry)
+            )
+        ''') \
+        .in_('id', commitment_ids)
+
+    sources_query = db.table('commitment_sources') \
+        .select('''
+            commitment_id,
+            data_sources(
+                id,
+                source_id,
+                source_type,
+                publisher,
+                author,
+                url,
+                date,
+                title,
+                reliability_score,
+                doc_type,
+                notes
+            )
+        ''') \
+        .in_('commitment_id', commitment_ids)
+
+    # The two queries are independent, so run them concurrently
+    result, sources_result = await asyncio.gather(
+        asyncio.to_thread(commitments_query.execute),
+        asyncio.to_thread(sources_query.execute),
     )
 
-    # Transform data
+    # Stitch sources back onto their commitments
+    sources_by_commitment = {}
+    for link in sources_result.data:
+        if link.get('data_sources'):
+            sources_by_commitment.setdefault(link['commitment_id'], []).append(link['data_sources'])
+
     commitments_data = []
     for commitment in result.data:
         commitment_dict = dict(commitment)
         profiles = commitment_dict.pop('profiles', None)
         if profiles and 'companies' in profiles:
             commitment_dict['company'] = profiles['companies']
-        commitment_dict['quote_count'] = len(commitment_dict.get('quotes') or [])
-        commitment_dict['source_count'] = len(commitment_dict.get('provenance_ids') or [])
+        commitment_dict['sources'] = sources_by_commitment.get(commitment_dict['id'], [])
         commitments_data.append(commitment_dict)
 
-    return {
-        "data": commitments_data,
-        "pagination": pagination.dict()
-    }
+    return {"data": commitments_data}
 
 
 @router.get("/{commitment_id}", response_model=dict)
@@ -114,7 +216,7 @@ async def get_commitment(
     """
     Get detailed information about a specific commitment.
     """
-    result = db.table('commitments') \
+    commitment_query = db.table('commitments') \
         .select('''
             *,
             profiles!inner(
@@ -123,21 +225,9 @@ async def get_commitment(
                 companies!inner(id, name, ticker, industry)
             )
         ''') \
-        .eq('id', commitment_id) \
-        .execute()
-
-    if not result.data or len(result.data) == 0:
-        raise HTTPException(status_code=404, detail="Commitment not found")
-
-    commitment_data = result.data[0]
-
-    # Transform company data
-    profiles = commitment_data.pop('profiles', None)
-    if profiles and 'companies' in profiles:
-        commitment_data['company'] = profiles['companies']
+        .eq('id', commitment_id)
 
-    # Fetch sources via junction table
-    sources_result = db.table('commitment_sources') \
+    sources_query = db.table('commitment_sources') \
         .select('''
             data_sources(
                 id,
@@ -153,8 +243,24 @@ async def get_commitment(
                 notes
             )
         ''') \
-        .eq('commitment_id', commitment_id) \
-        .execute()
+        .eq('commitment_id', commitment_id)
+
+    # Both queries only need the URL's commitment_id, so run them
+    # concurrently instead of back to back
+    result, sources_result = await asyncio.gather(
+        asyncio.to_thread(commitment_query.execute),
+        asyncio.to_thread(sources_query.execute),
+    )
+
+    if not result.data or len(result.data) == 0:
+        raise HTTPException(status_code=404, detail="Commitment not found")
+
+    commitment_data = result.data[0]
+
+    # Transform company data
+    profiles = commitment_data.pop('profiles', None)
+    if profiles and 'companies' in profiles:
+        commitment_data['company'] = profiles['companies']
 
     if sources_result.data:
         commitment_data['sources'] = [s['data_sources'] for s in sources_result.data if s.get('data_sources')]
@@ -176,41 +282,8 @@ async def get_commitment_type_stats(
     Returns count of total commitments, active commitments,
     and number of companies for each commitment type.
     """
-    # Get all commitments with company info
-    result = db.table('commitments') \
-        .select('''
-            commitment_type,
-            current_status,
-            profiles!inner(company_id)
-        ''') \
-        .execute()
+    # Grouped server-side by commitment_type_stats() (migrations/019);
+    # one row per type crosses the wire instead of every commitment
+    result = db.rpc('commitment_type_stats').execute()
 
-    # Calculate statistics
-    type_stats = {}
-    for commitment in result.data:
-        ctype = commitment['commitment_type']
-        if ctype not in type_stats:
-            type_stats[ctype] = {
-                'commitment_type': ctype,
-                'count': 0,
-                'active_count': 0,
-                'companies': set()
-            }
-
-        type_stats[ctype]['count'] += 1
-        if commitment['current_status'] == 'active':
-            type_stats[ctype]['active_count'] += 1
-        if 'profiles' in commitment and 'company_id' in commitment['profiles']:
-            type_stats[ctype]['companies'].add(commitment['profiles']['company_id'])
-
-    # Convert to list and format
-    stats_list = []
-    for ctype, stats in type_stats.items():
-        stats_list.append({
-            'commitment_type': stats['commitment_type'],
-            'count': stats['count'],
-            'active_count': stats['active_count'],
-            'companies_count': len(stats['companies'])
-        })
-
-    return {"data": stats_list}
+    return {"data": result.data}
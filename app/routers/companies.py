@@ -1,5 +1,5 @@
 """Companies API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, Request, Response
 from typing import List, Optional
 from supabase import Client
 from app.database import get_db
@@ -8,14 +8,19 @@ from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
 from app.config import get_settings
 from app.utils.cache import cached
+from app.utils.etag import conditional
+from app.utils.postgrest import quote_filter_value
 
 settings = get_settings()
 router = APIRouter(prefix="/companies", tags=["companies"])
 
 
 @router.get("/", response_model=dict)
+@conditional
 @cached("companies:list", ttl=300)
 async def list_companies(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     industry: Optional[str] = Query(None, description="Filter by industry"),
@@ -24,6 +29,9 @@ async def list_companies(
     search: Optional[str] = Query(None, description="Search by company name or ticker"),
     sort: str = Query("name", description="Sort field (name, ticker, industry, created_at)"),
     order: str = Query("asc", description="Sort order (asc, desc)"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
+    after_name: Optional[str] = Query(None, description="Keyset cursor: name of the last row on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last row on the previous page"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -32,6 +40,10 @@ async def list_companies(
 
     Supports filtering by industry, location, and search.
     Returns paginated results with metadata.
+
+    Pass the next_cursor values (after_name, after_id) from a previous
+    response for keyset pagination, which stays fast on deep pages where
+    OFFSET degrades linearly; the cursor pins the sort to name ascending.
     """
     # Calculate offset
     offset = (page - 1) * per_page
@@ -42,7 +54,9 @@ async def list_companies(
         '''
         *
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # We'll need to join with profiles_full separately for the summary fields
@@ -58,23 +72,38 @@ async def list_companies(
     if search:
         query = query.or_(f'name.ilike.%{search}%,ticker.ilike.%{search}%')
 
-    # Apply sorting
-    if order == "desc":
-        query = query.order(sort, desc=True)
+    # Apply sorting and pagination, then execute once; PostgREST returns
+    # the total count alongside the page when the select is count-enabled
+    if after_name:
+        # Keyset pagination on (name, id): every page is an index range
+        # scan from the cursor, so deep pages cost the same as page one
+        if after_id:
+            # Company names come back verbatim in next_cursor and often
+            # contain commas ("..., Inc."), so quote them as literals
+            cursor_name = quote_filter_value(after_name)
+            query = query.or_(
+                f"name.gt.{cursor_name},"
+                f"and(name.eq.{cursor_name},id.gt.{after_id})"
+            )
+        else:
+            query = query.gt('name', after_name)
+        query = query.order('name').order('id').limit(per_page)
+    elif order == "desc":
+        query = query.order(sort, desc=True).range(offset, offset + per_page - 1)
     else:
-        query = query.order(sort)
-
-    # Get total count (note: we need to get count before executing)
-    # The count is already set when we do select(..., count='exact')
-    # Apply pagination before executing
-    query = query.range(offset, offset + per_page - 1)
-
-    # Execute query
+        query = query.order(sort).range(offset, offset + per_page - 1)
     result = query.execute()
     companies_data = result.data
-
-    # Get total count from the result
-    total_count = result.count if hasattr(result, 'count') else len(companies_data)
+    total_count = result.count or 0
+
+    # A full page may have a successor; its last row is the next cursor
+    next_cursor = None
+    if len(companies_data) == per_page:
+        last = companies_data[-1]
+        next_cursor = {
+            "after_name": last['name'],
+            "after_id": last['id']
+        }
 
     # Get company IDs to fetch profile summaries
     company_ids = [c['id'] for c in companies_data]
@@ -105,7 +134,8 @@ async def list_companies(
         has_next=has_next,
         has_prev=has_prev,
         next_page=page + 1 if has_next else None,
-        prev_page=page - 1 if has_prev else None
+        prev_page=page - 1 if has_prev else None,
+        next_cursor=next_cursor
     )
 
     # Transform data to include lightweight profile info
@@ -132,7 +162,7 @@ async def list_companies(
 
     return {
         "data": companies_data,
-        "pagination": pagination.dict()
+        "pagination": pagination
     }
 
 
@@ -305,7 +335,11 @@ async def get_filter_options(
 
 
 @router.get("/search/advanced", response_model=dict)
+@conditional
+@cached("companies:search:advanced", ttl=300)
 async def advanced_search(
+    request: Request,
+    response: Response,
     q: Optional[str] = Query(None, description="Search query"),
     industries: Optional[List[str]] = Query(None, description="Filter by multiple industries"),
     countries: Optional[List[str]] = Query(None, description="Filter by multiple countries"),
@@ -313,6 +347,7 @@ async def advanced_search(
     min_sources: Optional[int] = Query(None, description="Minimum number of sources"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -330,7 +365,9 @@ async def advanced_search(
         *,
         profiles!inner(id, source_count)
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # Apply filters
@@ -346,12 +383,11 @@ async def advanced_search(
         
         query = query.or_(country_filter)
 
-    # Get results
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
-
+    # Apply pagination and execute once; PostgREST returns the total
+    # count alongside the page when the select is count-enabled
     query = query.range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count or 0
 
     # Post-process for min_sources filter
     companies_data = result.data
@@ -377,5 +413,5 @@ async def advanced_search(
 
     return {
         "data": companies_data,
-        "pagination": pagination.dict()
+        "pagination": pagination
     }
@@ -1,5 +1,6 @@
 """Controversies API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, Request, Response
 from typing import Optional
 from supabase import Client
 from app.database import get_db
@@ -7,13 +8,17 @@ from app.schemas import Controversy, ControversyWithCompany, PaginationMeta
 from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
 from app.utils.cache import cached
+from app.utils.etag import conditional
 
 router = APIRouter(prefix="/controversies", tags=["controversies"])
 
 
 @router.get("/", response_model=dict)
+@conditional
 @cached("controversies:list", ttl=300)
 async def list_controversies(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     profile_id: Optional[str] = Query(None, description="Filter by profile ID"),
@@ -21,6 +26,7 @@ async def list_controversies(
     type: Optional[str] = Query(None, description="Filter by controversy type"),
     status: Optional[str] = Query(None, description="Filter by status (ongoing, settled, dismissed)"),
     search: Optional[str] = Query(None, description="Search in description"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -51,7 +57,9 @@ async def list_controversies(
             companies!inner(id, name, ticker, industry)
         )
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # Apply filters
@@ -69,13 +77,11 @@ async def list_controversies(
     # Order by date descending
     query = query.order('date', desc=True)
 
-    # Get total count
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
-
-    # Apply pagination
+    # Apply pagination and execute once; PostgREST returns the total
+    # count alongside the page when the select is count-enabled
     query = query.range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count or 0
 
     # Calculate pagination
     total_pages = (total_count + per_page - 1) // per_page
@@ -101,7 +107,7 @@ async def list_controversies(
 
     return {
         "data": controversies_data,
-        "pagination": pagination.dict()
+        "pagination": pagination
     }
 
 
@@ -119,7 +125,7 @@ async def get_controversy(
     """
     Get detailed information about a specific controversy.
     """
-    result = db.table('controversies') \
+    controversy_query = db.table('controversies') \
         .select('''
             *,
             profiles!inner(
@@ -128,21 +134,9 @@ async def get_controversy(
                 companies!inner(id, name, ticker, industry)
             )
         ''') \
-        .eq('id', controversy_id) \
-        .execute()
-
-    if not result.data or len(result.data) == 0:
-        raise HTTPException(status_code=404, detail="Controversy not found")
-
-    controversy_data = result.data[0]
+        .eq('id', controversy_id)
 
-    # Transform company data
-    profiles = controversy_data.pop('profiles', None)
-    if profiles and 'companies' in profiles:
-        controversy_data['company'] = profiles['companies']
-
-    # Fetch sources via junction table
-    sources_result = db.table('controversy_sources') \
+    sources_query = db.table('controversy_sources') \
         .select('''
             data_sources(
                 id,
@@ -158,8 +152,24 @@ async def get_controversy(
                 notes
             )
         ''') \
-        .eq('controversy_id', controversy_id) \
-        .execute()
+        .eq('controversy_id', controversy_id)
+
+    # Both queries only need the URL's controversy_id, so run them
+    # concurrently instead of back to back
+    result, sources_result = await asyncio.gather(
+        asyncio.to_thread(controversy_query.execute),
+        asyncio.to_thread(sources_query.execute),
+    )
+
+    if not result.data or len(result.data) == 0:
+        raise HTTPException(status_code=404, detail="Controversy not found")
+
+    controversy_data = result.data[0]
+
+    # Transform company data
+    profiles = controversy_data.pop('profiles', None)
+    if profiles and 'companies' in profiles:
+        controversy_data['company'] = profiles['companies']
 
     if sources_result.data:
         controversy_data['sources'] = [s['data_sources'] for s in sources_result.data if s.get('data_sources')]
@@ -1,17 +1,24 @@
 """Events API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, Request, Response
 from typing import Optional
 from supabase import Client
 from app.database import get_db
 from app.schemas import Event, EventWithCompany, PaginationMeta
 from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
+from app.utils.cache import cached
+from app.utils.etag import conditional
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
 @router.get("/", response_model=dict)
+@conditional
+@cached("events:list", ttl=300)
 async def list_events(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     profile_id: Optional[str] = Query(None, description="Filter by profile ID"),
@@ -23,6 +30,7 @@ async def list_events(
     impact_direction: Optional[str] = Query(None, description="Filter by impact direction"),
     event_category: Optional[str] = Query(None, description="Filter by event category"),
     search: Optional[str] = Query(None, description="Search in headline or summary"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -56,7 +64,9 @@ async def list_events(
             companies!inner(id, name, ticker, industry)
         )
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # Apply filters
@@ -82,13 +92,11 @@ async def list_events(
     # Order by date descending (most recent first)
     query = query.order('date', desc=True)
 
-    # Get total count
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
-
-    # Apply pagination
+    # Apply pagination and execute once; PostgREST returns the total
+    # count alongside the page when the select is count-enabled
     query = query.range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count or 0
 
     # Calculate pagination
     total_pages = (total_count + per_page - 1) // per_page
@@ -114,11 +122,16 @@ async def list_events(
 
     return {
         "data": events_data,
-        "pagination": pagination.dict()
+        "pagination": pagination
     }
 
 
 @router.get("/{event_id}", response_model=dict)
+@cached(
+    "event:detail",
+    ttl=300,
+    key_builder=lambda event_id, db, key_validation: f"event:detail:{event_id}"
+)
 async def get_event(
     event_id: str,
     db: Client = Depends(get_db),
@@ -127,7 +140,7 @@ async def get_event(
     """
     Get detailed information about a specific event.
     """
-    result = db.table('events') \
+    event_query = db.table('events') \
         .select('''
             *,
             profiles!inner(
@@ -136,21 +149,9 @@ async def get_event(
                 companies!inner(id, name, ticker, industry)
             )
         ''') \
-        .eq('id', event_id) \
-        .execute()
-
-    if not result.data or len(result.data) == 0:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    event_data = result.data[0]
-
-    # Transform company data
-    profiles = event_data.pop('profiles', None)
-    if profiles and 'companies' in profiles:
-        event_data['company'] = profiles['companies']
+        .eq('id', event_id)
 
-    # Fetch sources via junction table
-    sources_result = db.table('event_sources') \
+    sources_query = db.table('event_sources') \
         .select('''
             data_sources(
                 id,
@@ -166,8 +167,24 @@ async def get_event(
                 notes
             )
         ''') \
-        .eq('event_id', event_id) \
-        .execute()
+        .eq('event_id', event_id)
+
+    # Both queries only need the URL's event_id, so run them
+    # concurrently instead of back to back
+    result, sources_result = await asyncio.gather(
+        asyncio.to_thread(event_query.execute),
+        asyncio.to_thread(sources_query.execute),
+    )
+
+    if not result.data or len(result.data) == 0:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    event_data = result.data[0]
+
+    # Transform company data
+    profiles = event_data.pop('profiles', None)
+    if profiles and 'companies' in profiles:
+        event_data['company'] = profiles['companies']
 
     if sources_result.data:
         event_data['sources'] = [s['data_sources'] for s in sources_result.data if s.get('data_sources')]
@@ -178,6 +195,7 @@ async def get_event(
 
 
 @router.get("/types/stats", response_model=dict)
+@cached("events:types:stats", ttl=600)
 async def get_event_type_stats(
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
@@ -1,26 +1,42 @@
 """Profiles API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, Request, Response
 from typing import Optional
 from supabase import Client
-from app.database import get_db
+from app.database import get_db, get_pg_pool
 from app.schemas import Profile, FullProfile, PaginationMeta
 from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
 from app.config import get_settings
 from app.utils.cache import cached
+from app.utils.etag import conditional
 
 settings = get_settings()
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
 
+# The entire full-profile payload is assembled server-side by the
+# get_full_profile() SQL function (migrations/002) in a single round trip
+_FULL_PROFILE_SQL = "SELECT get_full_profile($1::uuid)"
+
+_LATEST_PROFILE_ID_SQL = """
+SELECT id FROM profiles WHERE company_id = $1::uuid AND is_latest LIMIT 1
+"""
+
+
 @router.get("/", response_model=dict)
+@conditional
 @cached("profiles:list", ttl=300)
 async def list_profiles(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     company_id: Optional[str] = Query(None, description="Filter by company ID"),
     min_sources: Optional[int] = Query(None, description="Minimum source count"),
     is_latest: bool = Query(True, description="Only show latest profiles"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
+    after_created_at: Optional[str] = Query(None, description="Keyset cursor: created_at of the last row on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last row on the previous page"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -28,6 +44,10 @@ async def list_profiles(
     List all DEI profiles with optional filtering.
 
     Returns profile metadata with company information.
+
+    Pass the next_cursor values (after_created_at, after_id) from a
+    previous response for keyset pagination, which stays fast on deep
+    pages where OFFSET degrades linearly.
     """
     offset = (page - 1) * per_page
 
@@ -42,11 +62,16 @@ async def list_profiles(
         research_captured_at,
         research_notes,
         source_count,
+        commitment_count,
+        controversy_count,
+        event_count,
         is_latest,
         created_at,
         companies!inner(id, name, ticker, industry)
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # Apply filters
@@ -57,13 +82,33 @@ async def list_profiles(
     if min_sources:
         query = query.gte('source_count', min_sources)
 
-    # Get total count
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
-
-    # Apply pagination
-    query = query.range(offset, offset + per_page - 1)
+    # Apply pagination and execute once; PostgREST returns the total
+    # count alongside the page when the select is count-enabled
+    if after_created_at:
+        # Keyset pagination on (created_at, id): every page is an index
+        # range scan from the cursor, so deep pages cost the same as
+        # page one
+        if after_id:
+            query = query.or_(
+                f"created_at.gt.{after_created_at},"
+                f"and(created_at.eq.{after_created_at},id.gt.{after_id})"
+            )
+        else:
+            query = query.gt('created_at', after_created_at)
+        query = query.order('created_at').order('id').limit(per_page)
+    else:
+        query = query.range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count or 0
+
+    # A full page may have a successor; its last row is the next cursor
+    next_cursor = None
+    if len(result.data) == per_page:
+        last = result.data[-1]
+        next_cursor = {
+            "after_created_at": last['created_at'],
+            "after_id": last['id']
+        }
 
     # Calculate pagination
     total_pages = (total_count + per_page - 1) // per_page
@@ -75,21 +120,21 @@ async def list_profiles(
         has_next=page < total_pages,
         has_prev=page > 1,
         next_page=page + 1 if page < total_pages else None,
-        prev_page=page - 1 if page > 1 else None
+        prev_page=page - 1 if page > 1 else None,
+        next_cursor=next_cursor
     )
 
-    # Transform data
-    profiles_data = []
-    for profile in result.data:
-        profile_dict = dict(profile)
-        companies = profile_dict.pop('companies', None)
+    # Rename the embedded companies resource in place; PostgREST already
+    # returns fresh plain dicts, so no per-row copy is needed
+    profiles_data = result.data
+    for profile in profiles_data:
+        companies = profile.pop('companies', None)
         if companies:
-            profile_dict['company'] = companies
-        profiles_data.append(profile_dict)
+            profile['company'] = companies
 
     return {
         "data": profiles_data,
-        "pagination": pagination.dict()
+        "pagination": pagination
     }
 
 
@@ -109,7 +154,7 @@ async def get_profile(
     """
     # Default to full profile
     if full:
-        return await get_full_profile(profile_id, db, key_validation)
+        return await _build_full_profile(profile_id)
 
     # Lightweight version
     result = db.table('profiles') \
@@ -122,6 +167,9 @@ async def get_profile(
             research_captured_at,
             research_notes,
             source_count,
+            commitment_count,
+            controversy_count,
+            event_count,
             is_latest,
             created_at,
             companies!inner(id, name, ticker, industry, hq_city, hq_state, hq_country)
@@ -141,12 +189,32 @@ async def get_profile(
     return {"data": profile_data}
 
 
-@router.get("/{profile_id}/full", response_model=dict)
 @cached(
     "profile:full",
     ttl=900,  # Cache for 15 minutes
-    key_builder=lambda profile_id, db, key_validation: f"profile:full:{profile_id}"
+    key_builder=lambda profile_id: f"profile:full:{profile_id}"
 )
+async def _build_full_profile(profile_id: str):
+    """
+    Build the complete DEI profile payload with all components.
+
+    Shared by the /full endpoint and the full=true paths of get_profile
+    and get_latest_profile_for_company, so the cache decorator and its
+    key builder only run once per request regardless of entry point.
+
+    The whole nested payload is built by the get_full_profile() Postgres
+    function in one query over the asyncpg pool.
+    """
+    pool = get_pg_pool()
+
+    profile_data = await pool.fetchval(_FULL_PROFILE_SQL, profile_id)
+    if profile_data is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    return {"data": profile_data}
+
+
+@router.get("/{profile_id}/full", response_model=dict)
 async def get_full_profile(
     profile_id: str,
     db: Client = Depends(get_db),
@@ -168,186 +236,7 @@ async def get_full_profile(
 
     Results are cached for 15 minutes.
     """
-    # Get base profile
-    profile_result = db.table('profiles') \
-        .select('''
-            id,
-            company_id,
-            schema_version,
-            profile_type,
-            generated_at,
-            research_captured_at,
-            research_notes,
-            source_count,
-            is_latest,
-            created_at,
-            companies!inner(id, name, ticker, industry, hq_city, hq_state, hq_country)
-        ''') \
-        .eq('id', profile_id) \
-        .execute()
-
-    if not profile_result.data or len(profile_result.data) == 0:
-        raise HTTPException(status_code=404, detail="Profile not found")
-
-    profile_data = profile_result.data[0]
-    profile_data['company'] = profile_data.pop('companies', None)
-
-    # Get AI Context
-    ai_context_result = db.table('ai_contexts') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if ai_context_result.data:
-        profile_data['ai_context'] = ai_context_result.data[0]
-
-    # Get AI Key Insights
-    insights_result = db.table('ai_key_insights') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .order('insight_order') \
-        .execute()
-    profile_data['key_insights'] = insights_result.data
-
-    # Get AI Strategic Implications
-    implications_result = db.table('ai_strategic_implications') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .order('implication_order') \
-        .execute()
-    profile_data['strategic_implications'] = implications_result.data
-
-    # Get DEI Posture
-    posture_result = db.table('dei_postures') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if posture_result.data:
-        profile_data['dei_posture'] = posture_result.data[0]
-
-    # Get CDO Role
-    cdo_result = db.table('cdo_roles') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if cdo_result.data:
-        profile_data['cdo_role'] = cdo_result.data[0]
-
-    # Get Reporting Practices
-    reporting_result = db.table('reporting_practices') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if reporting_result.data:
-        profile_data['reporting_practices'] = reporting_result.data[0]
-
-    # Get Supplier Diversity
-    supplier_result = db.table('supplier_diversity') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if supplier_result.data:
-        profile_data['supplier_diversity'] = supplier_result.data[0]
-
-    # Get Risk Assessment
-    risk_result = db.table('risk_assessments') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if risk_result.data:
-        profile_data['risk_assessment'] = risk_result.data[0]
-
-    # Get Data Quality Flags
-    quality_result = db.table('data_quality_flags') \
-        .select('*') \
-        .eq('profile_id', profile_id) \
-        .execute()
-    if quality_result.data:
-        profile_data['data_quality_flags'] = quality_result.data[0]
-
-    # Get related data counts and samples
-    commitments_result = db.table('commitments') \
-        .select('id, commitment_name, commitment_type, current_status, quotes') \
-        .eq('profile_id', profile_id) \
-        .execute()
-
-    # Fetch sources for each commitment via junction table
-    commitments_data = []
-    for commitment in commitments_result.data:
-        commitment_dict = dict(commitment)
-        sources_result = db.table('commitment_sources') \
-            .select('data_sources(id, source_id, source_type, title, url, date, reliability_score)') \
-            .eq('commitment_id', commitment['id']) \
-            .execute()
-        if sources_result.data:
-            commitment_dict['sources'] = [s['data_sources'] for s in sources_result.data if s.get('data_sources')]
-        else:
-            commitment_dict['sources'] = []
-        commitments_data.append(commitment_dict)
-
-    profile_data['commitments'] = commitments_data
-    profile_data['commitment_count'] = len(commitments_data)
-
-    controversies_result = db.table('controversies') \
-        .select('id, type, status, description, date, case_name, quotes') \
-        .eq('profile_id', profile_id) \
-        .execute()
-
-    # Fetch sources for each controversy via junction table
-    controversies_data = []
-    for controversy in controversies_result.data:
-        controversy_dict = dict(controversy)
-        sources_result = db.table('controversy_sources') \
-            .select('data_sources(id, source_id, source_type, title, url, date, reliability_score)') \
-            .eq('controversy_id', controversy['id']) \
-            .execute()
-        if sources_result.data:
-            controversy_dict['sources'] = [s['data_sources'] for s in sources_result.data if s.get('data_sources')]
-        else:
-            controversy_dict['sources'] = []
-        controversies_data.append(controversy_dict)
-
-    profile_data['controversies'] = controversies_data
-    profile_data['controversy_count'] = len(controversies_data)
-
-    events_result = db.table('events') \
-        .select('id, date, event_type, headline, sentiment, impact, impact_magnitude, impact_direction, event_category, summary, quotes') \
-        .eq('profile_id', profile_id) \
-        .execute()
-
-    # Fetch sources for each event via junction table
-    events_data = []
-    for event in events_result.data:
-        event_dict = dict(event)
-        sources_result = db.table('event_sources') \
-            .select('data_sources(id, source_id, source_type, title, url, date, reliability_score)') \
-            .eq('event_id', event['id']) \
-            .execute()
-        if sources_result.data:
-            event_dict['sources'] = [s['data_sources'] for s in sources_result.data if s.get('data_sources')]
-        else:
-            event_dict['sources'] = []
-        events_data.append(event_dict)
-
-    profile_data['events'] = events_data
-    profile_data['event_count'] = len(events_data)
-
-    sources_result = db.table('data_sources') \
-        .select('id, source_id, source_type, title, url, date, reliability_score, notes, publisher, author, doc_type') \
-        .eq('profile_id', profile_id) \
-        .order('date', desc=True) \
-        .execute()
-
-    # Transform notes to summary for frontend compatibility
-    sources_data = []
-    for source in sources_result.data:
-        source_dict = dict(source)
-        if 'notes' in source_dict:
-            source_dict['summary'] = source_dict.get('notes')
-        sources_data.append(source_dict)
-
-    profile_data['sources'] = sources_data
-
-    return {"data": profile_data}
+    return await _build_full_profile(profile_id)
 
 
 @router.get("/company/{company_id}/latest", response_model=dict)
@@ -363,24 +252,19 @@ async def get_latest_profile_for_company(
     By default returns the complete profile with all components.
     Set full=false for a lighter response.
     """
-    # Get latest profile
-    result = db.table('profiles') \
-        .select('id') \
-        .eq('company_id', company_id) \
-        .eq('is_latest', True) \
-        .limit(1) \
-        .execute()
+    # Resolve the latest profile id over the asyncpg pool: one indexed
+    # lookup on the binary protocol instead of a PostgREST HTTP round trip
+    pool = get_pg_pool()
+    profile_id = await pool.fetchval(_LATEST_PROFILE_ID_SQL, company_id)
 
-    if not result.data or len(result.data) == 0:
+    if profile_id is None:
         raise HTTPException(
             status_code=404,
             detail=f"No profile found for company {company_id}"
         )
 
-    profile_id = result.data[0]['id']
-
     # Redirect to get_profile which handles full parameter
-    return await get_profile(profile_id, full, db, key_validation)
+    return await get_profile(str(profile_id), full, db, key_validation)
 
 
 @router.get("/ranked/at-risk", response_model=dict)
@@ -1,11 +1,13 @@
 """Data sources API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, BackgroundTasks, Request, Response
 from typing import Optional
 from supabase import Client
 from app.database import get_db
-from app.schemas import DataSource, DataSourceWithCompany, SourceTypeStats, PaginationMeta
+from app.schemas import DataSource, DataSourceWithCompany, SourceType, SourceTypeStats, PaginationMeta
 from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
+from app.utils.cache import cached
+from app.utils.etag import conditional
 from app.utils.fetch_title import fetch_titles_batch, fetch_page_title
 import logging
 
@@ -15,15 +17,22 @@ router = APIRouter(prefix="/sources", tags=["sources"])
 
 
 @router.get("/", response_model=dict)
+@conditional
+@cached("sources:list", ttl=300)
 async def list_sources(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     profile_id: Optional[str] = Query(None, description="Filter by profile ID"),
     company_id: Optional[str] = Query(None, description="Filter by company ID"),
-    source_type: Optional[str] = Query(None, description="Filter by type"),
+    source_type: Optional[SourceType] = Query(None, description="Filter by type"),
     min_reliability: Optional[int] = Query(None, ge=1, le=5, description="Minimum reliability score"),
     publisher: Optional[str] = Query(None, description="Filter by publisher"),
     search: Optional[str] = Query(None, description="Search in title and notes"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
+    after_date: Optional[str] = Query(None, description="Keyset cursor: date of the last row on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: id of the last row on the previous page"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -31,11 +40,16 @@ async def list_sources(
     List all data sources with filtering.
 
     Sources document the evidence and research behind DEI profiles.
+
+    Pass the next_cursor values (after_date, after_id) from a previous
+    response for keyset pagination, which stays fast on deep pages where
+    OFFSET degrades linearly.
     """
     offset = (page - 1) * per_page
 
-    # Build query
-    query = db.table('data_sources').select(
+    # Build query against the pre-joined view (migrations/023), whose
+    # rows already carry the company object in the response shape
+    query = db.table('data_sources_with_company').select(
         '''
         id,
         profile_id,
@@ -49,20 +63,18 @@ async def list_sources(
         reliability_score,
         doc_type,
         notes,
-        profiles!inner(
-            id,
-            company_id,
-            companies!inner(id, name, ticker)
-        )
+        company
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact
+        # counts scan the filtered query and are opt-in
+        count='exact' if exact_count else 'estimated'
     )
 
     # Apply filters
     if profile_id:
         query = query.eq('profile_id', profile_id)
     if source_type:
-        query = query.eq('source_type', source_type)
+        query = query.eq('source_type', source_type.value)
     if min_reliability:
         query = query.gte('reliability_score', min_reliability)
     if publisher:
@@ -70,18 +82,36 @@ async def list_sources(
     if search:
         query = query.or_(f'title.ilike.%{search}%,notes.ilike.%{search}%')
     if company_id:
-        query = query.eq('profiles.company_id', company_id)
-
-    # Order by date descending
-    query = query.order('date', desc=True)
-
-    # Get total count
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
-
-    # Apply pagination
-    query = query.range(offset, offset + per_page - 1)
+        query = query.eq('company_id', company_id)
+
+    # Apply the date-descending order and pagination, then execute once;
+    # PostgREST returns the total count alongside the page when the
+    # select is count-enabled
+    if after_date:
+        # Keyset pagination on (date, id) descending: every page is a
+        # backward index range scan from the cursor, so deep pages cost
+        # the same as page one
+        if after_id:
+            query = query.or_(
+                f"date.lt.{after_date},"
+                f"and(date.eq.{after_date},id.lt.{after_id})"
+            )
+        else:
+            query = query.lt('date', after_date)
+        query = query.order('date', desc=True).order('id', desc=True).limit(per_page)
+    else:
+        query = query.order('date', desc=True).range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count or 0
+
+    # A full page may have a successor; its last row is the next cursor
+    next_cursor = None
+    if len(result.data) == per_page:
+        last = result.data[-1]
+        next_cursor = {
+            "after_date": last['date'],
+            "after_id": last['id']
+        }
 
     # Calculate pagination
     total_pages = (total_count + per_page - 1) // per_page
@@ -93,25 +123,22 @@ async def list_sources(
         has_next=page < total_pages,
         has_prev=page > 1,
         next_page=page + 1 if page < total_pages else None,
-        prev_page=page - 1 if page > 1 else None
+        prev_page=page - 1 if page > 1 else None,
+        next_cursor=next_cursor
     )
 
-    # Transform data
-    sources_data = []
-    for source in result.data:
-        source_dict = dict(source)
-        profiles = source_dict.pop('profiles', None)
-        if profiles and 'companies' in profiles:
-            source_dict['company'] = profiles['companies']
-        sources_data.append(source_dict)
-
     return {
-        "data": sources_data,
-        "pagination": pagination.dict()
+        "data": result.data,
+        "pagination": pagination
     }
 
 
 @router.get("/{source_id}", response_model=dict)
+@cached(
+    "source:detail",
+    ttl=300,
+    key_builder=lambda source_id, db, key_validation: f"source:detail:{source_id}"
+)
 async def get_source(
     source_id: str,
     db: Client = Depends(get_db),
@@ -146,6 +173,7 @@ async def get_source(
 
 
 @router.get("/types/stats", response_model=dict)
+@cached("sources:types:stats", ttl=600)
 async def get_source_type_stats(
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
@@ -155,48 +183,11 @@ async def get_source_type_stats(
 
     Returns count and average reliability score for each source type.
     """
-    # Get all sources
-    result = db.table('data_sources') \
-        .select('source_type, reliability_score') \
-        .execute()
-
-    # Calculate statistics
-    type_stats = {}
-    for source in result.data:
-        stype = source['source_type']
-        if stype not in type_stats:
-            type_stats[stype] = {
-                'source_type': stype,
-                'count': 0,
-                'total_reliability': 0,
-                'reliability_count': 0
-            }
-
-        type_stats[stype]['count'] += 1
-        if source.get('reliability_score'):
-            type_stats[stype]['total_reliability'] += source['reliability_score']
-            type_stats[stype]['reliability_count'] += 1
-
-    # Convert to list and calculate averages
-    stats_list = []
-    for stype, stats in type_stats.items():
-        avg_reliability = None
-        if stats['reliability_count'] > 0:
-            avg_reliability = round(
-                stats['total_reliability'] / stats['reliability_count'],
-                2
-            )
-
-        stats_list.append({
-            'source_type': stats['source_type'],
-            'count': stats['count'],
-            'avg_reliability': avg_reliability
-        })
-
-    # Sort by count descending
-    stats_list.sort(key=lambda x: x['count'], reverse=True)
+    # Grouped server-side by source_type_stats() (migrations/019),
+    # already sorted by count; avg(reliability_score) skips nulls
+    result = db.rpc('source_type_stats').execute()
 
-    return {"data": stats_list}
+    return {"data": result.data}
 
 
 @router.post("/fetch-titles", response_model=dict)
@@ -1,17 +1,55 @@
 """Supplier Diversity API endpoints."""
-from fastapi import APIRouter, HTTPException, Query, Depends, Security
+import asyncio
+import time
+from fastapi import APIRouter, HTTPException, Query, Depends, Security, Request, Response
 from typing import Optional
 from supabase import Client
-from app.database import get_db
+from app.database import get_db, get_pg_pool
+from app.redis_client import get_cache, set_cache
 from app.schemas import PaginationMeta
 from app.schemas.api_key import APIKeyValidation
 from app.middleware.auth import verify_api_key
+from app.utils.etag import compute_etag as _compute_etag
 
 router = APIRouter(prefix="/supplier-diversity", tags=["supplier_diversity"])
 
+# Single-row reads go straight through the asyncpg pool so the handlers
+# stay non-blocking instead of serializing on the sync PostgREST client
+
+_SUPPLIER_DETAIL_SQL = """
+    SELECT jsonb_build_object(
+        'profile_id', sd.profile_id,
+        'program_exists', sd.program_exists,
+        'program_status', sd.program_status,
+        'spending_disclosed', sd.spending_disclosed,
+        'quotes', sd.quotes,
+        'provenance_ids', sd.provenance_ids,
+        'created_at', sd.created_at,
+        'updated_at', sd.updated_at,
+        'company', jsonb_build_object(
+            'id', c.id, 'name', c.name, 'ticker', c.ticker, 'industry', c.industry
+        )
+    )
+    FROM supplier_diversity sd
+    JOIN profiles p ON p.id = sd.profile_id
+    JOIN companies c ON c.id = p.company_id
+    WHERE sd.profile_id = $1::uuid
+"""
+
+_STATS_MV_SQL = "SELECT to_jsonb(x) FROM supplier_diversity_stats_mv x"
+
+# In-process memo for the stats payload, shared by all requests in a worker,
+# backed by a Redis key shared across workers and pods
+_STATS_CACHE_TTL = 60  # seconds
+_STATS_REDIS_KEY = "stats:supplier_diversity"
+_stats_cache: dict = {}
+_stats_lock = asyncio.Lock()
+
 
 @router.get("/", response_model=dict)
 async def list_supplier_diversity(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     profile_id: Optional[str] = Query(None, description="Filter by profile ID"),
@@ -19,6 +57,9 @@ async def list_supplier_diversity(
     program_exists: Optional[bool] = Query(None, description="Filter by program existence"),
     program_status: Optional[str] = Query(None, description="Filter by program status"),
     spending_disclosed: Optional[bool] = Query(None, description="Filter by spending disclosure"),
+    exact_count: bool = Query(False, description="Use an exact (slower) total count for pagination"),
+    after_created_at: Optional[str] = Query(None, description="Keyset cursor: created_at of the last row on the previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor: profile_id of the last row on the previous page"),
     db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
@@ -27,13 +68,19 @@ async def list_supplier_diversity(
 
     Supplier diversity programs track company commitments to engaging
     diverse suppliers in their supply chains.
+
+    Pass the next_cursor values (after_created_at, after_id) from a
+    previous response for keyset pagination, which stays fast on deep
+    pages where OFFSET degrades linearly.
     """
     offset = (page - 1) * per_page
 
-    # Build query
-    query = db.table('supplier_diversity').select(
+    # Build query against the pre-joined view (migrations/006), whose rows
+    # already carry the company object in the response shape
+    query = db.table('supplier_diversity_with_company').select(
         '''
         profile_id,
+        company_id,
         program_exists,
         program_status,
         spending_disclosed,
@@ -41,34 +88,51 @@ async def list_supplier_diversity(
         provenance_ids,
         created_at,
         updated_at,
-        profiles!inner(
-            id,
-            company_id,
-            companies!inner(id, name, ticker, industry)
-        )
+        company
         ''',
-        count='exact'
+        # Estimated counts come from planner statistics in O(1); exact counts
+        # scan the filtered join and are opt-in for callers that need them
+        count='exact' if exact_count else 'estimated'
     )
 
-    # Apply filters
-    if profile_id:
-        query = query.eq('profile_id', profile_id)
-    if program_exists is not None:
-        query = query.eq('program_exists', program_exists)
-    if program_status:
-        query = query.eq('program_status', program_status)
-    if spending_disclosed is not None:
-        query = query.eq('spending_disclosed', spending_disclosed)
-    if company_id:
-        query = query.eq('profiles.company_id', company_id)
-
-    # Get total count
-    count_result = query.execute()
-    total_count = count_result.count if hasattr(count_result, 'count') else len(count_result.data)
-
-    # Apply pagination
-    query = query.range(offset, offset + per_page - 1)
+    # Apply filters from a single (column, value) table
+    for col, val in (
+        ('profile_id', profile_id),
+        ('company_id', company_id),
+        ('program_exists', program_exists),
+        ('program_status', program_status),
+        ('spending_disclosed', spending_disclosed),
+    ):
+        if val is not None:
+            query = query.eq(col, val)
+
+    # Apply pagination and execute once; PostgREST returns the total count
+    # alongside the page when the select is count-enabled
+    if after_created_at:
+        # Keyset pagination on (created_at, profile_id): every page is an
+        # index range scan from the cursor, with no rows scanned and
+        # discarded, so deep pages cost the same as page one
+        if after_id:
+            query = query.or_(
+                f"created_at.gt.{after_created_at},"
+                f"and(created_at.eq.{after_created_at},profile_id.gt.{after_id})"
+            )
+        else:
+            query = query.gt('created_at', after_created_at)
+        query = query.order('created_at').order('profile_id').limit(per_page)
+    else:
+        query = query.range(offset, offset + per_page - 1)
     result = query.execute()
+    total_count = result.count if result.count is not None else len(result.data)
+
+    # A full page may have a successor; its last row is the next cursor
+    next_cursor = None
+    if len(result.data) == per_page:
+        last = result.data[-1]
+        next_cursor = {
+            "after_created_at": last['created_at'],
+            "after_id": last['profile_id']
+        }
 
     # Calculate pagination
     total_pages = (total_count + per_page - 1) // per_page
@@ -80,91 +144,97 @@ async def list_supplier_diversity(
         has_next=page < total_pages,
         has_prev=page > 1,
         next_page=page + 1 if page < total_pages else None,
-        prev_page=page - 1 if page > 1 else None
+        prev_page=page - 1 if page > 1 else None,
+        next_cursor=next_cursor
     )
 
-    # Transform data
-    supplier_data = []
-    for item in result.data:
-        item_dict = dict(item)
-        profiles = item_dict.pop('profiles', None)
-        if profiles and 'companies' in profiles:
-            item_dict['company'] = profiles['companies']
-        supplier_data.append(item_dict)
-
-    return {
-        "data": supplier_data,
-        "pagination": pagination.dict()
+    payload = {
+        "data": result.data,
+        "pagination": pagination
     }
 
+    # Conditional response: pollers resending our ETag skip the body
+    etag = _compute_etag(payload)
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    return payload
+
 
 @router.get("/{profile_id}", response_model=dict)
 async def get_supplier_diversity(
     profile_id: str,
-    db: Client = Depends(get_db),
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
     """
     Get supplier diversity program information for a specific profile.
     """
-    result = db.table('supplier_diversity') \
-        .select('''
-            *,
-            profiles!inner(
-                id,
-                company_id,
-                companies!inner(id, name, ticker, industry)
-            )
-        ''') \
-        .eq('profile_id', profile_id) \
-        .execute()
+    supplier_data = await get_pg_pool().fetchval(_SUPPLIER_DETAIL_SQL, profile_id)
 
-    if not result.data or len(result.data) == 0:
+    if supplier_data is None:
         raise HTTPException(status_code=404, detail="Supplier diversity program not found")
 
-    supplier_data = result.data[0]
-
-    # Transform company data
-    profiles = supplier_data.pop('profiles', None)
-    if profiles and 'companies' in profiles:
-        supplier_data['company'] = profiles['companies']
-
     return {"data": supplier_data}
 
 
 @router.get("/stats/overview", response_model=dict)
 async def get_supplier_diversity_stats(
-    db: Client = Depends(get_db),
+    request: Request,
+    response: Response,
     key_validation: APIKeyValidation = Security(verify_api_key)
 ):
     """
     Get overall statistics for supplier diversity programs.
 
     Returns counts and breakdowns by program status and disclosure.
+    Responses are memoized in-process for 60 seconds and support
+    If-None-Match revalidation.
     """
-    # Get all supplier diversity records
-    result = db.table('supplier_diversity') \
-        .select('program_exists, program_status, spending_disclosed') \
-        .execute()
-
-    total = len(result.data)
-    programs_exist = sum(1 for r in result.data if r.get('program_exists'))
-    spending_disclosed = sum(1 for r in result.data if r.get('spending_disclosed'))
-
-    # Status breakdown
-    status_breakdown = {}
-    for record in result.data:
-        status = record.get('program_status', 'unknown')
-        if status:
-            status_breakdown[status] = status_breakdown.get(status, 0) + 1
-
-    return {
-        "data": {
-            "total_companies": total,
-            "programs_exist": programs_exist,
-            "programs_exist_percentage": round((programs_exist / total * 100), 1) if total > 0 else 0,
-            "spending_disclosed": spending_disclosed,
-            "spending_disclosed_percentage": round((spending_disclosed / total * 100), 1) if total > 0 else 0,
-            "status_breakdown": status_breakdown
+    response.headers["Cache-Control"] = f"public, max-age={_STATS_CACHE_TTL}"
+
+    async with _stats_lock:
+        entry = _stats_cache.get('stats')
+        if entry and entry[0] > time.monotonic():
+            _, cached_payload, cached_etag = entry
+            if request.headers.get('if-none-match') == cached_etag:
+                return Response(status_code=304, headers={"ETag": cached_etag})
+            response.headers["ETag"] = cached_etag
+            return cached_payload
+
+    # Shared Redis layer: another worker may have computed the payload
+    # already, in which case the database is skipped entirely
+    payload = await get_cache(_STATS_REDIS_KEY)
+
+    if payload is None:
+        # Precomputed by supplier_diversity_stats_mv (migrations/004), which
+        # is refreshed on a schedule; this is a single-row indexed read
+        stats = await get_pg_pool().fetchval(_STATS_MV_SQL) or {}
+
+        total = stats.get('total', 0)
+        programs_exist = stats.get('programs_exist', 0)
+        spending_disclosed = stats.get('spending_disclosed', 0)
+        status_breakdown = stats.get('status_breakdown') or {}
+
+        payload = {
+            "data": {
+                "total_companies": total,
+                "programs_exist": programs_exist,
+                "programs_exist_percentage": round((programs_exist / total * 100), 1) if total > 0 else 0,
+                "spending_disclosed": spending_disclosed,
+                "spending_disclosed_percentage": round((spending_disclosed / total * 100), 1) if total > 0 else 0,
+                "status_breakdown": status_breakdown
+            }
         }
-    }
+
+        await set_cache(_STATS_REDIS_KEY, payload, _STATS_CACHE_TTL)
+
+    etag = _compute_etag(payload)
+    async with _stats_lock:
+        _stats_cache['stats'] = (time.monotonic() + _STATS_CACHE_TTL, payload, etag)
+
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    return payload
@@ -30,6 +30,8 @@ from app.schemas.profile import (
     FullProfile,
 )
 from app.schemas.commitment import (
+    CommitmentType,
+    CommitmentStatus,
     CommitmentBase,
     CommitmentCreate,
     CommitmentUpdate,
@@ -52,6 +54,7 @@ from app.schemas.event import (
     EventWithCompany,
 )
 from app.schemas.source import (
+    SourceType,
     DataSourceBase,
     DataSourceCreate,
     DataSourceUpdate,
@@ -99,6 +102,8 @@ __all__ = [
     "DataQualityFlags",
     "FullProfile",
     # Commitment
+    "CommitmentType",
+    "CommitmentStatus",
     "CommitmentBase",
     "CommitmentCreate",
     "CommitmentUpdate",
@@ -118,6 +123,7 @@ __all__ = [
     "Event",
     "EventWithCompany",
     # Source
+    "SourceType",
     "DataSourceBase",
     "DataSourceCreate",
     "DataSourceUpdate",
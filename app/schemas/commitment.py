@@ -1,4 +1,5 @@
 """Commitment-related schemas."""
+from enum import Enum
 from pydantic import BaseModel, UUID4
 from datetime import datetime
 from typing import Optional, List
@@ -9,6 +10,19 @@ if TYPE_CHECKING:
     from app.schemas.source import DataSource
 
 
+class CommitmentType(str, Enum):
+    """Valid commitment_type filter values; typos 422 before any DB call."""
+    pledge = "pledge"
+    industry_initiative = "industry_initiative"
+
+
+class CommitmentStatus(str, Enum):
+    """Valid current_status filter values; typos 422 before any DB call."""
+    active = "active"
+    completed = "completed"
+    discontinued = "discontinued"
+
+
 class CommitmentBase(BaseModel):
     """Base commitment fields."""
     commitment_name: str
@@ -1,6 +1,6 @@
 """Common schemas and utilities."""
 from pydantic import BaseModel
-from typing import Optional, List, Any
+from typing import Optional, List, Any, TypedDict
 from datetime import datetime
 
 
@@ -10,16 +10,27 @@ class PaginationParams(BaseModel):
     per_page: int = 20
 
 
-class PaginationMeta(BaseModel):
-    """Pagination metadata in responses."""
+class _PaginationMetaOptional(TypedDict, total=False):
+    """Keys only present on endpoints that support keyset pagination."""
+    next_cursor: Optional[dict]
+
+
+class PaginationMeta(_PaginationMetaOptional):
+    """
+    Pagination metadata in responses.
+
+    A TypedDict rather than a BaseModel: every list endpoint builds one of
+    these per request and embeds it in a plain dict payload, so model
+    validation and serialization would be pure overhead on the hot path.
+    """
     page: int
     per_page: int
     total_pages: int
     total_count: int
     has_next: bool
     has_prev: bool
-    next_page: Optional[int] = None
-    prev_page: Optional[int] = None
+    next_page: Optional[int]
+    prev_page: Optional[int]
 
 
 class PaginatedResponse(BaseModel):
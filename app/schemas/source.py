@@ -1,10 +1,19 @@
 """Data source-related schemas."""
+from enum import Enum
 from pydantic import BaseModel, UUID4
 from datetime import date
 from typing import Optional
 from app.schemas.company import CompanySummary
 
 
+class SourceType(str, Enum):
+    """Valid source_type filter values; typos 422 before any DB call."""
+    corporate_website = "corporate_website"
+    news_article = "news_article"
+    regulatory_filing = "regulatory_filing"
+    trade_press = "trade_press"
+
+
 class DataSourceBase(BaseModel):
     """Base data source fields."""
     source_id: str
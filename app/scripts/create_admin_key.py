@@ -10,9 +10,10 @@ Usage:
 """
 import argparse
 import sys
-from datetime import datetime
-from app.database import get_db
-from app.middleware.auth import generate_api_key, hash_api_key
+
+# Banners built once instead of per print
+SEP70 = "=" * 70
+DASH70 = "-" * 70
 
 
 def create_admin_key(name: str = "Initial Admin Key", expires_at: str = None):
@@ -23,6 +24,11 @@ def create_admin_key(name: str = "Initial Admin Key", expires_at: str = None):
         name: Descriptive name for the API key
         expires_at: Optional expiration date (ISO format)
     """
+    # Imported here so argument parsing (and --help) doesn't pay for
+    # the database stack
+    from app.database import get_db
+    from app.middleware.auth import generate_api_key, hash_api_key
+
     db = get_db()
 
     # Generate a new admin key
@@ -31,10 +37,11 @@ def create_admin_key(name: str = "Initial Admin Key", expires_at: str = None):
     key_prefix = admin_key[:8]
 
     try:
-        # Check if any admin keys already exist
-        existing = db.table("api_keys").select("id").eq("is_admin", True).execute()
+        # Check if any admin keys already exist; head=True returns just
+        # the count header without shipping any rows
+        existing = db.table("api_keys").select("id", count="exact", head=True).eq("is_admin", True).execute()
 
-        if existing.data and len(existing.data) > 0:
+        if existing.count and existing.count > 0:
             print("⚠️  Warning: Admin API keys already exist in the database.")
             response = input("Do you want to create another admin key? (y/N): ")
             if response.lower() != 'y':
@@ -59,24 +66,24 @@ def create_admin_key(name: str = "Initial Admin Key", expires_at: str = None):
         created_key = response.data[0]
 
         # Display the key information
-        print("\n" + "="*70)
+        print("\n" + SEP70)
         print("✅ ADMIN API KEY CREATED SUCCESSFULLY")
-        print("="*70)
+        print(SEP70)
         print(f"\nKey ID:      {created_key['id']}")
         print(f"Name:        {created_key['name']}")
         print(f"Created:     {created_key['created_at']}")
         print(f"Expires:     {created_key.get('expires_at', 'Never')}")
-        print("\n" + "-"*70)
+        print("\n" + DASH70)
         print("API KEY (save this - it will not be shown again):")
-        print("-"*70)
+        print(DASH70)
         print(f"\n{admin_key}\n")
-        print("-"*70)
+        print(DASH70)
         print("\n⚠️  IMPORTANT:")
         print("   - Save this API key in a secure location")
         print("   - It will NOT be shown again")
         print("   - Use it in the 'X-API-Key' header for API requests")
         print("   - This key can create and manage other API keys")
-        print("="*70 + "\n")
+        print(SEP70 + "\n")
 
         # Save to .env reminder
         print("💡 To use this key, add it to your .env file or use it directly:")
@@ -1,4 +1,4 @@
 """Utility modules."""
-from app.utils.cache import cached, build_query_cache_key
+from app.utils.cache import cached, build_query_cache_key, make_key_builder
 
-__all__ = ["cached", "build_query_cache_key"]
+__all__ = ["cached", "build_query_cache_key", "make_key_builder"]
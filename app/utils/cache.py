@@ -1,7 +1,40 @@
 """Caching utilities and decorators."""
-from functools import wraps
+import asyncio
+import hashlib
+from functools import lru_cache, wraps
 from typing import Optional, Callable
-from app.redis_client import get_cache, set_cache
+import orjson
+from app.redis_client import get_cache, get_cache_many, set_cache
+
+# Dependency-injected arguments that must never leak into cache keys
+_EXCLUDED_KWARGS = frozenset({'db', 'key_validation'})
+
+# Cache misses in flight, keyed by cache key, so concurrent callers of
+# the same key await one computation instead of stampeding the source
+_inflight: dict = {}
+
+
+def _fingerprint(args: tuple, kwargs: dict) -> str:
+    """
+    Canonical blake2b digest of the call arguments.
+
+    orjson with sorted keys gives a stable byte representation, and
+    blake2b is considerably faster than the sha/md5 family, keeping the
+    cache-hit path cheap. Injected dependencies and unserializable values
+    are excluded.
+    """
+    payload = {
+        'a': [a for a in args if isinstance(a, (str, int, float, bool))],
+        'kw': {
+            k: v for k, v in kwargs.items()
+            if k not in _EXCLUDED_KWARGS
+            and isinstance(v, (str, int, float, bool, list, dict))
+        }
+    }
+    return hashlib.blake2b(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
 
 
 def cached(
@@ -33,19 +66,34 @@ def cached(
             if key_builder:
                 cache_key = key_builder(*args, **kwargs)
             else:
-                # Default: use prefix and stringified args
-                args_str = "_".join(str(arg) for arg in args if arg is not None)
-                kwargs_str = "_".join(f"{k}={v}" for k, v in kwargs.items() if v is not None)
-                suffix = "_".join(filter(None, [args_str, kwargs_str]))
-                cache_key = f"{key_prefix}:{suffix}" if suffix else key_prefix
+                # Default: prefix plus a hashed fingerprint of the arguments
+                cache_key = f"{key_prefix}:{_fingerprint(args, kwargs)}"
 
             # Try to get from cache
             cached_result = await get_cache(cache_key)
             if cached_result is not None:
                 return cached_result
 
-            # Execute function
-            result = await func(*args, **kwargs)
+            # Single-flight: if another caller is already computing this
+            # key, await its result instead of duplicating the work
+            existing = _inflight.get(cache_key)
+            if existing is not None:
+                return await existing
+
+            future = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = future
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+                # Awaiters receive the exception; avoid the "never
+                # retrieved" warning when there are none
+                future.exception()
+                raise
+            finally:
+                _inflight.pop(cache_key, None)
+
+            future.set_result(result)
 
             # Cache result
             await set_cache(cache_key, result, ttl)
@@ -56,6 +104,53 @@ def cached(
     return decorator
 
 
+def cached_batch(
+    key_prefix: str,
+    ttl: Optional[int] = None,
+    key_builder: Optional[Callable] = None
+):
+    """
+    Decorator to cache per-id results of a batch function in Redis.
+
+    The wrapped function must take a list of ids and return a dict
+    mapping each id to its value. Cached entries are fetched with a
+    single MGET (one round-trip for N keys), and only the missing ids
+    are passed through to the wrapped function before being cached.
+
+    Usage:
+        @cached_batch("company", ttl=300)
+        async def get_companies(company_ids: list[str]) -> dict:
+            ...
+    """
+    build_key = key_builder or (lambda item_id: f"{key_prefix}:{item_id}")
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(ids, *args, **kwargs):
+            ids = list(ids)
+            keys = [build_key(item_id) for item_id in ids]
+            cached_values = await get_cache_many(keys)
+
+            results = {}
+            missing = []
+            for item_id, value in zip(ids, cached_values):
+                if value is not None:
+                    results[item_id] = value
+                else:
+                    missing.append(item_id)
+
+            if missing:
+                fresh = await func(missing, *args, **kwargs)
+                for item_id, value in fresh.items():
+                    results[item_id] = value
+                    await set_cache(build_key(item_id), value, ttl)
+
+            return results
+
+        return wrapper
+    return decorator
+
+
 def build_query_cache_key(prefix: str, **params) -> str:
     """
     Build a cache key from query parameters.
@@ -74,3 +169,32 @@ def build_query_cache_key(prefix: str, **params) -> str:
 
     params_str = "_".join(f"{k}={v}" for k, v in sorted(filtered_params.items()))
     return f"{prefix}:{params_str}"
+
+
+@lru_cache(maxsize=None)
+def make_key_builder(prefix: str, param_names: tuple) -> Callable:
+    """
+    Build a specialized key builder for a fixed set of parameter names.
+
+    The names are sorted once here instead of on every request, so the
+    returned function only formats and joins the non-None values. Key
+    output matches build_query_cache_key for the same inputs.
+
+    Usage:
+        _list_key = make_key_builder("sources:list", ("page", "per_page"))
+        ...
+        cache_key = _list_key(page=2, per_page=20)
+    """
+    sorted_names = tuple(sorted(param_names))
+
+    def key_builder(**params) -> str:
+        parts = [
+            f"{name}={params[name]}"
+            for name in sorted_names
+            if params.get(name) is not None
+        ]
+        if not parts:
+            return prefix
+        return f"{prefix}:{'_'.join(parts)}"
+
+    return key_builder
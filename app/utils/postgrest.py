@@ -0,0 +1,14 @@
+"""PostgREST query-syntax helpers."""
+
+
+def quote_filter_value(value: str) -> str:
+    """Quote a literal for embedding in a PostgREST filter expression.
+
+    Inside or=(...) trees the value shares its grammar with the
+    expression itself, so commas, parentheses, and quotes in the data
+    would be parsed as filter syntax and fail with a PGRST100 error.
+    Double-quoting with backslash escapes makes any string safe per
+    PostgREST's reserved-character rules.
+    """
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
@@ -59,9 +59,12 @@ except Exception as e:
         os.getenv('SUPABASE_SERVICE_ROLE_KEY')
     )
 
-    # Check if there are any text/jsonb fields we're missing
-    result = supabase.table('profiles').select('*').limit(1).execute()
-    if result.data:
+    # Only field names are needed here; the OpenAPI root returns the
+    # column list without shipping any row data
+    schema_resp = supabase.postgrest.session.get('/')
+    definitions = schema_resp.json().get('definitions', {})
+    columns = definitions.get('profiles', {}).get('properties', {})
+    if columns:
         print("\nAll profile fields:")
-        for key in result.data[0].keys():
+        for key in columns:
             print(f"  - {key}")
@@ -11,18 +11,18 @@ supabase = create_client(
     os.getenv('SUPABASE_SERVICE_ROLE_KEY')
 )
 
-# Get a full profile with all fields
-result = supabase.table('profiles').select('*').limit(1).execute()
+# Read the field list from the PostgREST OpenAPI root; select('*') would
+# pull every JSONB/text blob over the wire just to show truncated previews
+schema_resp = supabase.postgrest.session.get('/')
+definitions = schema_resp.json().get('definitions', {})
+columns = definitions.get('profiles', {}).get('properties', {})
 
-if result.data:
-    profile = result.data[0]
+if columns:
     print("Profile Fields:")
     print("=" * 80)
-    for key, value in profile.items():
-        if isinstance(value, str) and len(value) > 200:
-            print(f"{key}: {value[:200]}...")
-        else:
-            print(f"{key}: {value}")
+    for key, spec in columns.items():
+        col_type = spec.get('format') or spec.get('type', 'unknown')
+        print(f"{key}: {col_type}")
 
     print("\n" + "=" * 80)
     print("\nChecking for AI analysis content...")
@@ -32,5 +32,5 @@ if result.data:
     print("\nAll table names:")
     tables = ['profiles', 'companies', 'data_sources', 'commitments']
     for table in tables:
-        count = supabase.table(table).select('*', count='exact').limit(0).execute()
+        count = supabase.table(table).select('id', count='exact').limit(0).execute()
         print(f"  {table}: {count.count} rows")
@@ -1,11 +1,17 @@
+from functools import lru_cache
 from supabase import create_client, Client
 from config import get_settings
 
 settings = get_settings()
 
 
+@lru_cache()
 def get_supabase_client() -> Client:
-    """Get Supabase client instance"""
+    """Get the shared Supabase client instance.
+
+    Built once and reused so every handler rides the same pooled HTTP
+    session instead of paying a TCP + TLS handshake per request.
+    """
     return create_client(
         settings.supabase_url,
         settings.supabase_service_role_key
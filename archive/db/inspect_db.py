@@ -1,118 +1,150 @@
 #!/usr/bin/env python3
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Banner built once instead of on every print
+SEP80 = "=" * 80
+DASH80 = "-" * 80
 
-DATABASE_URL = os.getenv('DATABASE_URL')
+# Rows shown per table; raise for deeper sampling
+SAMPLE_ROWS = 3
+
+def _short(value, n=100):
+    """Single str() pass with truncation for sample-row display"""
+    s = str(value)
+    return s if len(s) <= n else s[:n - 3] + "..."
 
 def inspect_database():
     """Connect to database and inspect all tables"""
+    # Heavy imports stay inside the entry point so the module imports
+    # instantly (e.g. for --help or tooling)
+    import psycopg2
+    from psycopg2 import sql
+    from psycopg2.extras import RealDictCursor
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     try:
         # Connect to database
-        conn = psycopg2.connect(DATABASE_URL)
+        conn = psycopg2.connect(os.getenv('DATABASE_URL'))
+        conn.set_session(readonly=True)
         cur = conn.cursor(cursor_factory=RealDictCursor)
 
-        print("=" * 80)
+        print(SEP80)
         print("DATABASE SCHEMA INSPECTION")
-        print("=" * 80)
+        print(SEP80)
 
-        # Get all tables in public schema
+        # Fetch all schema metadata up front in three queries instead of
+        # four round-trips per table, then group by table in Python
+
+        # All columns for every public table
         cur.execute("""
-            SELECT table_name
-            FROM information_schema.tables
+            SELECT
+                table_name,
+                column_name,
+                data_type,
+                character_maximum_length,
+                is_nullable,
+                column_default
+            FROM information_schema.columns
             WHERE table_schema = 'public'
-            ORDER BY table_name;
+            ORDER BY table_name, ordinal_position;
+        """)
+        columns_by_table = {}
+        for col in cur.fetchall():
+            columns_by_table.setdefault(col['table_name'], []).append(col)
+
+        # Planner row estimates for every table in one shot; COUNT(*)
+        # per table would scan each heap
+        cur.execute("""
+            SELECT relname, GREATEST(reltuples, 0)::bigint AS count
+            FROM pg_class
+            WHERE relnamespace = 'public'::regnamespace
+            AND relkind = 'r';
+        """)
+        counts = {row['relname']: row['count'] for row in cur.fetchall()}
+
+        # All foreign keys in the schema, grouped by table
+        cur.execute("""
+            SELECT
+                tc.table_name,
+                tc.constraint_name,
+                kcu.column_name,
+                ccu.table_name AS foreign_table_name,
+                ccu.column_name AS foreign_column_name
+            FROM information_schema.table_constraints AS tc
+            JOIN information_schema.key_column_usage AS kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+            JOIN information_schema.constraint_column_usage AS ccu
+                ON ccu.constraint_name = tc.constraint_name
+                AND ccu.table_schema = tc.table_schema
+            WHERE tc.constraint_type = 'FOREIGN KEY'
+            AND tc.table_schema = 'public';
         """)
-        tables = cur.fetchall()
+        fks_by_table = {}
+        for fk in cur.fetchall():
+            fks_by_table.setdefault(fk['table_name'], []).append(fk)
+
+        tables = sorted(columns_by_table)
 
         print(f"\nFound {len(tables)} tables in public schema:\n")
 
-        for table_row in tables:
-            table_name = table_row['table_name']
-            print(f"\n{'=' * 80}")
+        for table_name in tables:
+            print(f"\n{SEP80}")
             print(f"TABLE: {table_name}")
-            print('=' * 80)
-
-            # Get columns for this table
-            cur.execute("""
-                SELECT
-                    column_name,
-                    data_type,
-                    character_maximum_length,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = %s
-                ORDER BY ordinal_position;
-            """, (table_name,))
-
-            columns = cur.fetchall()
+            print(SEP80)
+
+            columns = columns_by_table[table_name]
 
             print(f"\nColumns ({len(columns)}):")
-            print("-" * 80)
+            print(DASH80)
             for col in columns:
                 max_len = f"({col['character_maximum_length']})" if col['character_maximum_length'] else ""
                 nullable = "NULL" if col['is_nullable'] == 'YES' else "NOT NULL"
                 default = f"DEFAULT {col['column_default']}" if col['column_default'] else ""
                 print(f"  {col['column_name']:<30} {col['data_type']}{max_len:<20} {nullable:<10} {default}")
 
-            # Get row count
-            cur.execute(f"SELECT COUNT(*) as count FROM {table_name};")
-            count = cur.fetchone()['count']
-            print(f"\nRow count: {count}")
+            # Planner estimate (approximate; -1 means never analyzed)
+            count = counts.get(table_name, 0)
+            print(f"\nRow count (estimated): {count}")
 
-            # Show sample data if available
+            # Show sample data if available; a named (server-side)
+            # cursor streams rows in itersize batches, so memory stays
+            # bounded if SAMPLE_ROWS is ever raised
             if count > 0:
-                cur.execute(f"SELECT * FROM {table_name} LIMIT 3;")
-                samples = cur.fetchall()
-                print(f"\nSample data (up to 3 rows):")
-                print("-" * 80)
-                for i, row in enumerate(samples, 1):
-                    print(f"\nRow {i}:")
-                    for key, value in row.items():
-                        # Truncate long values
-                        str_value = str(value)
-                        if len(str_value) > 100:
-                            str_value = str_value[:97] + "..."
-                        print(f"  {key}: {str_value}")
-
-            # Get foreign key constraints
-            cur.execute("""
-                SELECT
-                    tc.constraint_name,
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table_name,
-                    ccu.column_name AS foreign_column_name
-                FROM information_schema.table_constraints AS tc
-                JOIN information_schema.key_column_usage AS kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage AS ccu
-                    ON ccu.constraint_name = tc.constraint_name
-                    AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                AND tc.table_schema = 'public'
-                AND tc.table_name = %s;
-            """, (table_name,))
-
-            fks = cur.fetchall()
+                # Plain tuple cursor here: RealDictCursor allocates a
+                # dict per row, wasteful for wide tables when the names
+                # are available once from cur.description
+                with conn.cursor(name='sample_cur') as sample_cur:
+                    sample_cur.itersize = 100
+                    sample_cur.execute(
+                        sql.SQL("SELECT * FROM {} LIMIT %s").format(sql.Identifier(table_name)),
+                        (SAMPLE_ROWS,)
+                    )
+                    print(f"\nSample data (up to {SAMPLE_ROWS} rows):")
+                    print(DASH80)
+                    col_names = None
+                    for i, row in enumerate(sample_cur, 1):
+                        if col_names is None:
+                            col_names = [d.name for d in sample_cur.description]
+                        print(f"\nRow {i}:")
+                        for name, value in zip(col_names, row):
+                            print(f"  {name}: {_short(value)}")
+
+            fks = fks_by_table.get(table_name)
             if fks:
                 print(f"\nForeign Keys:")
-                print("-" * 80)
+                print(DASH80)
                 for fk in fks:
                     print(f"  {fk['column_name']} -> {fk['foreign_table_name']}.{fk['foreign_column_name']}")
 
         cur.close()
         conn.close()
 
-        print("\n" + "=" * 80)
+        print("\n" + SEP80)
         print("INSPECTION COMPLETE")
-        print("=" * 80)
+        print(SEP80)
 
     except Exception as e:
         print(f"Error: {e}")
@@ -1,20 +1,21 @@
 #!/usr/bin/env python3
-from supabase import create_client, Client
 import os
-from dotenv import load_dotenv
-import json
-
-# Load environment variables
-load_dotenv()
-
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
 
 def inspect_supabase():
     """Connect to Supabase and inspect all tables"""
+    # Heavy imports stay inside the entry point so the module imports
+    # instantly (e.g. for --help or tooling)
+    from supabase import create_client
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     try:
         # Create Supabase client
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+        supabase = create_client(
+            os.getenv('SUPABASE_URL'),
+            os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+        )
 
         print("=" * 80)
         print("SUPABASE DATABASE INSPECTION")
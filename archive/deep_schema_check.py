@@ -1,87 +1,143 @@
 #!/usr/bin/env python3
-from supabase import create_client
+import asyncio
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-supabase = create_client(
-    os.getenv('SUPABASE_URL'),
-    os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-)
-
-print("Deep search for AI fields across all tables...")
-print("=" * 80)
-
-tables = ['profiles', 'companies', 'data_sources', 'commitments']
-
-for table_name in tables:
-    print(f"\n{table_name.upper()}")
-    print("-" * 80)
-
-    try:
-        # Get first row
-        result = supabase.table(table_name).select('*').limit(1).execute()
-
-        if result.data:
-            all_fields = list(result.data[0].keys())
-
-            # Look for AI-related fields
-            ai_fields = [f for f in all_fields if any(keyword in f.lower() for keyword in ['ai', 'insight', 'analysis', 'context', 'assessment', 'finding', 'posture', 'narrative'])]
-
-            print(f"Total fields: {len(all_fields)}")
-            print(f"All fields: {', '.join(all_fields)}")
-
-            if ai_fields:
-                print(f"\n✓ AI-related fields found: {ai_fields}")
-
-                for field in ai_fields:
-                    value = result.data[0][field]
-                    if value:
-                        print(f"\n  {field}:")
-                        if isinstance(value, str):
-                            print(f"    Type: string ({len(value)} chars)")
-                            print(f"    Preview: {value[:200]}")
-                        else:
-                            print(f"    Value: {value}")
-            else:
-                print("  ❌ No AI-related fields")
-
-    except Exception as e:
-        print(f"  Error: {e}")
-
-# Try explicitly selecting ai_context and ai_key_insights
-print("\n" + "=" * 80)
-print("Trying to explicitly select ai_context and ai_key_insights...")
-print("=" * 80)
-
-try:
-    result = supabase.table('profiles').select('ai_context, ai_key_insights').limit(1).execute()
-    print(f"✓ Success! Found fields:")
-    print(result.data)
-except Exception as e:
-    print(f"❌ Error: {e}")
-
-# Try selecting everything with rpc
-print("\n" + "=" * 80)
-print("Checking if there's a view or different schema...")
-print("=" * 80)
-
-# List all possible field names
-possible_ai_fields = [
-    'ai_context', 'ai_key_insights', 'ai_analysis', 'ai_summary',
-    'context', 'key_insights', 'insights', 'analysis', 'assessment',
-    'dei_analysis', 'dei_context', 'dei_insights', 'dei_assessment',
-    'narrative', 'posture', 'findings', 'summary'
-]
-
-for field_name in possible_ai_fields:
-    try:
-        result = supabase.table('profiles').select(field_name).limit(1).execute()
-        if result.data and result.data[0].get(field_name) is not None:
-            print(f"✓ Found: {field_name}")
-            value = result.data[0][field_name]
-            if isinstance(value, str):
-                print(f"  Preview: {value[:150]}")
-    except:
-        pass
+import re
+
+# Field/table probes are tiny and independent; overlap their round-trips
+PROBE_CONCURRENCY = 20
+
+# One compiled alternation per field instead of eight substring scans
+AI_FIELD_RE = re.compile(r'ai|insight|analysis|context|assessment|finding|posture|narrative')
+
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+
+def deep_schema_check():
+    """Search every table for AI-analysis fields"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    asyncio.run(_check(
+        os.getenv('SUPABASE_URL'),
+        os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+    ))
+
+
+async def _check(supabase_url, supabase_key):
+    import httpx
+
+    print("Deep search for AI fields across all tables...")
+    print(SEP80)
+
+    tables = ['profiles', 'companies', 'data_sources', 'commitments']
+
+    sem = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def fetch_sample(client, table_name, select='*'):
+        """Fetch one row; returns the row list or raises on HTTP errors"""
+        async with sem:
+            response = await client.get(
+                f"/rest/v1/{table_name}",
+                params={'select': select, 'limit': 1}
+            )
+        response.raise_for_status()
+        return response.json()
+
+    async with httpx.AsyncClient(
+        base_url=supabase_url,
+        headers={
+            'apikey': supabase_key,
+            'Authorization': f'Bearer {supabase_key}'
+        },
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=32,
+            keepalive_expiry=60
+        ),
+        timeout=httpx.Timeout(10.0, connect=3.0)
+    ) as client:
+        # Sample all four tables in one overlapped burst
+        sample_results = await asyncio.gather(
+            *[fetch_sample(client, name) for name in tables],
+            return_exceptions=True
+        )
+
+        for table_name, data in zip(tables, sample_results):
+            print(f"\n{table_name.upper()}")
+            print(DASH80)
+
+            if isinstance(data, Exception):
+                print(f"  Error: {data}")
+                continue
+
+            if data:
+                all_fields = list(data[0].keys())
+
+                # Look for AI-related fields
+                ai_fields = [f for f in all_fields if AI_FIELD_RE.search(f.lower())]
+
+                print(f"Total fields: {len(all_fields)}")
+                print(f"All fields: {', '.join(all_fields)}")
+
+                if ai_fields:
+                    print(f"\n✓ AI-related fields found: {ai_fields}")
+
+                    for field in ai_fields:
+                        value = data[0][field]
+                        if value:
+                            print(f"\n  {field}:")
+                            if isinstance(value, str):
+                                print(f"    Type: string ({len(value)} chars)")
+                                print(f"    Preview: {value[:200]}")
+                            else:
+                                print(f"    Value: {value}")
+                else:
+                    print("  ❌ No AI-related fields")
+
+        # Try explicitly selecting ai_context and ai_key_insights
+        print("\n" + SEP80)
+        print("Trying to explicitly select ai_context and ai_key_insights...")
+        print(SEP80)
+
+        try:
+            data = await fetch_sample(client, 'profiles', 'ai_context, ai_key_insights')
+            print(f"✓ Success! Found fields:")
+            print(data)
+        except Exception as e:
+            print(f"❌ Error: {e}")
+
+        # Try selecting everything with rpc
+        print("\n" + SEP80)
+        print("Checking if there's a view or different schema...")
+        print(SEP80)
+
+        # List all possible field names
+        possible_ai_fields = [
+            'ai_context', 'ai_key_insights', 'ai_analysis', 'ai_summary',
+            'context', 'key_insights', 'insights', 'analysis', 'assessment',
+            'dei_analysis', 'dei_context', 'dei_insights', 'dei_assessment',
+            'narrative', 'posture', 'findings', 'summary'
+        ]
+
+        # The catalog knows the column list; one RPC replaces ~18
+        # existence probes (migrations/012)
+        response = await client.post('/rest/v1/rpc/profile_columns', json={})
+        response.raise_for_status()
+        cols = set(response.json())
+
+        present = [f for f in possible_ai_fields if f in cols]
+        if present:
+            data = await fetch_sample(client, 'profiles', ','.join(present))
+            for field_name in present:
+                if data and data[0].get(field_name) is not None:
+                    print(f"✓ Found: {field_name}")
+                    value = data[0][field_name]
+                    if isinstance(value, str):
+                        print(f"  Preview: {value[:150]}")
+
+
+if __name__ == "__main__":
+    deep_schema_check()
@@ -1,38 +1,93 @@
 #!/usr/bin/env python3
-from supabase import create_client
+import asyncio
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-supabase = create_client(
-    os.getenv('SUPABASE_URL'),
-    os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-)
-
-# Try to find tables with analysis/assessment content
-potential_tables = [
-    'profiles', 'companies', 'data_sources', 'commitments',
-    'analysis', 'assessments', 'stances', 'posture', 'dei_analysis',
-    'insights', 'findings', 'summary', 'evaluation', 'report',
-    'content', 'narrative', 'overview'
-]
-
-print("Searching for tables with AI analysis content...")
-print("=" * 80)
-
-found_tables = []
-for table_name in potential_tables:
-    try:
-        result = supabase.table(table_name).select('*', count='exact').limit(1).execute()
-        found_tables.append(table_name)
-        print(f"✓ Found: {table_name} ({result.count} rows)")
-
-        if result.data:
-            print(f"  Sample columns: {list(result.data[0].keys())}")
-    except Exception:
-        pass
-
-print(f"\n{'=' * 80}")
-print(f"Total tables found: {len(found_tables)}")
-print(f"Tables: {', '.join(found_tables)}")
+
+# Cap in-flight probes so the burst stays within PostgREST's comfort zone
+PROBE_CONCURRENCY = 20
+
+SEP80 = "=" * 80
+
+
+def discover_analysis_tables():
+    """Probe for tables that might hold AI analysis content"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    asyncio.run(_discover(
+        os.getenv('SUPABASE_URL'),
+        os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+    ))
+
+
+async def _discover(supabase_url, supabase_key):
+    import httpx
+
+    # Try to find tables with analysis/assessment content
+    potential_tables = [
+        'profiles', 'companies', 'data_sources', 'commitments',
+        'analysis', 'assessments', 'stances', 'posture', 'dei_analysis',
+        'insights', 'findings', 'summary', 'evaluation', 'report',
+        'content', 'narrative', 'overview'
+    ]
+
+    print("Searching for tables with AI analysis content...")
+    print(SEP80)
+
+    sem = asyncio.Semaphore(PROBE_CONCURRENCY)
+
+    async def probe(client, table_name):
+        """One GET fetches the count header and a sample row together"""
+        async with sem:
+            try:
+                response = await client.get(
+                    f"/rest/v1/{table_name}",
+                    params={'select': '*', 'limit': 1},
+                    headers={'Prefer': 'count=planned'}
+                )
+            except httpx.HTTPError:
+                return None
+        if response.status_code not in (200, 206):
+            return None
+        content_range = response.headers.get('content-range', '')
+        try:
+            count = int(content_range.rsplit('/', 1)[1])
+        except (IndexError, ValueError):
+            count = 0
+        return {'name': table_name, 'count': count, 'data': response.json()}
+
+    async with httpx.AsyncClient(
+        base_url=supabase_url,
+        headers={
+            'apikey': supabase_key,
+            'Authorization': f'Bearer {supabase_key}'
+        },
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=32,
+            keepalive_expiry=60
+        ),
+        timeout=httpx.Timeout(10.0, connect=3.0)
+    ) as client:
+        results = await asyncio.gather(
+            *[probe(client, name) for name in potential_tables]
+        )
+
+    found_tables = []
+    for table in results:
+        if table is None:
+            continue
+        found_tables.append(table['name'])
+        print(f"✓ Found: {table['name']} ({table['count']} rows)")
+
+        if table['data']:
+            print(f"  Sample columns: {list(table['data'][0].keys())}")
+
+    print(f"\n{SEP80}")
+    print(f"Total tables found: {len(found_tables)}")
+    print(f"Tables: {', '.join(found_tables)}")
+
+
+if __name__ == "__main__":
+    discover_analysis_tables()
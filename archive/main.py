@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from config import get_settings
 from routers import companies, profiles, sources, commitments, analytics
 
@@ -8,6 +9,9 @@ settings = get_settings()
 app = FastAPI(
     title=settings.app_name,
     version=settings.api_version,
+    # orjson encodes the big list payloads several times faster than the
+    # stdlib encoder and handles UUID/datetime natively
+    default_response_class=ORJSONResponse,
     description="""
     API for tracking corporate DEI stances, commitments, and changes.
 
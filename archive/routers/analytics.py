@@ -1,54 +1,64 @@
+import time
+from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from database import get_supabase_client
-from collections import defaultdict
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+# In-process TTL memo for the aggregate endpoints; platform-wide stats
+# change on the order of hours, so a short TTL removes almost all of
+# the Supabase round-trips under load
+_cache: dict = {}
+
+def _cache_get(key):
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _cache_put(key, value, ttl):
+    _cache[key] = (time.monotonic() + ttl, value)
+
 
 @router.get("/overview", response_model=dict)
 async def get_overview():
     """Get overall platform statistics"""
+    cached = _cache_get('overview')
+    if cached is not None:
+        return cached
+
     supabase = get_supabase_client()
 
-    # Get counts
-    companies_result = supabase.table('companies').select('*', count='exact').execute()
-    profiles_result = supabase.table('profiles').select('*', count='exact').execute()
-    sources_result = supabase.table('data_sources').select('source_type', count='exact').execute()
-    commitments_result = supabase.table('commitments').select('current_status', count='exact').execute()
+    # Get counts; head=True returns only the count header, no rows, and
+    # count='planned' reads the planner's reltuples estimate instead of
+    # scanning — platform-overview numbers don't need to be exact
+    companies_result = supabase.table('companies').select('id', count='planned', head=True).execute()
+    profiles_result = supabase.table('profiles').select('id', count='planned', head=True).execute()
 
     total_companies = companies_result.count or 0
     total_profiles = profiles_result.count or 0
-    total_sources = sources_result.count or 0
-    total_commitments = commitments_result.count or 0
-
-    # Source type breakdown
-    source_type_breakdown = {}
-    for source in sources_result.data:
-        source_type = source.get('source_type')
-        if source_type:
-            source_type_breakdown[source_type] = source_type_breakdown.get(source_type, 0) + 1
-
-    # Commitment status breakdown
-    commitment_status_breakdown = {}
-    for commitment in commitments_result.data:
-        status = commitment.get('current_status')
-        if status:
-            commitment_status_breakdown[status] = commitment_status_breakdown.get(status, 0) + 1
-
-    # Get industries
-    industries_result = supabase.table('companies').select('industry').execute()
-    industries_covered = len(set(row['industry'] for row in industries_result.data if row.get('industry')))
-
-    # Get countries
-    countries_result = supabase.table('companies').select('hq_country').execute()
-    countries_covered = len(set(row['hq_country'] for row in countries_result.data if row.get('hq_country')))
+
+    # Totals and breakdowns grouped server-side by overview_breakdowns()
+    # (migrations/018); one RPC returns jsonb objects instead of rows
+    breakdowns_result = supabase.rpc('overview_breakdowns').execute()
+    breakdowns = breakdowns_result.data[0] if breakdowns_result.data else {}
+    total_sources = breakdowns.get('total_sources') or 0
+    total_commitments = breakdowns.get('total_commitments') or 0
+    source_type_breakdown = breakdowns.get('source_types') or {}
+    commitment_status_breakdown = breakdowns.get('commitment_statuses') or {}
+
+    # Distinct industry/country counts computed server-side in one scan
+    dims_result = supabase.rpc('dei_overview_dims').execute()
+    dims = dims_result.data[0] if dims_result.data else {}
+    industries_covered = dims.get('industries', 0)
+    countries_covered = dims.get('countries', 0)
 
     # Calculate averages
     avg_sources = round(total_sources / total_companies, 1) if total_companies > 0 else 0
     avg_commitments = round(total_commitments / total_companies, 1) if total_companies > 0 else 0
 
-    return {
+    response = {
         "data": {
             "total_companies": total_companies,
             "total_profiles": total_profiles,
@@ -62,74 +72,42 @@ async def get_overview():
             "commitment_status_breakdown": commitment_status_breakdown
         }
     }
+    _cache_put('overview', response, 60)
+    return response
 
 
 @router.get("/industries", response_model=dict)
 async def get_industries_stats():
     """Get DEI statistics by industry"""
+    cached = _cache_get('industries')
+    if cached is not None:
+        return cached
+
     supabase = get_supabase_client()
 
-    # Get all data
-    companies_result = supabase.table('companies').select('id, industry').execute()
-    profiles_result = supabase.table('profiles').select('company_id, source_count').execute()
-    commitments_result = supabase.table('commitments').select('profile_id, current_status').execute()
-
-    # Build profile lookup
-    profile_by_company = {}
-    for profile in profiles_result.data:
-        profile_by_company[profile['company_id']] = profile
-
-    # Build commitment lookup
-    commitments_by_profile = defaultdict(list)
-    for commitment in commitments_result.data:
-        commitments_by_profile[commitment['profile_id']].append(commitment)
-
-    # Aggregate by industry
-    industry_stats = defaultdict(lambda: {
-        'company_count': 0,
-        'total_sources': 0,
-        'total_commitments': 0,
-        'active_commitments': 0
-    })
-
-    for company in companies_result.data:
-        industry = company.get('industry')
-        if not industry:
-            continue
-
-        company_id = company['id']
-        stats = industry_stats[industry]
-        stats['company_count'] += 1
-
-        # Add sources
-        if company_id in profile_by_company:
-            profile = profile_by_company[company_id]
-            stats['total_sources'] += profile.get('source_count', 0)
-
-            # Add commitments
-            profile_id = profile.get('id')
-            if profile_id in commitments_by_profile:
-                commitments = commitments_by_profile[profile_id]
-                stats['total_commitments'] += len(commitments)
-                stats['active_commitments'] += sum(1 for c in commitments if c.get('current_status') == 'active')
+    # Grouped server-side by industry_stats(); one aggregate row per
+    # industry instead of three full-table fetches joined in Python
+    stats_result = supabase.rpc('industry_stats').execute()
 
     # Format response
     data = []
-    for industry, stats in industry_stats.items():
-        company_count = stats['company_count']
+    for row in stats_result.data:
+        company_count = row['company_count']
         data.append({
-            'industry': industry,
+            'industry': row['industry'],
             'company_count': company_count,
-            'avg_sources': round(stats['total_sources'] / company_count, 1) if company_count > 0 else 0,
-            'avg_commitments': round(stats['total_commitments'] / company_count, 1) if company_count > 0 else 0,
-            'total_commitments': stats['total_commitments'],
-            'active_commitments': stats['active_commitments']
+            'avg_sources': round(row['total_sources'] / company_count, 1) if company_count > 0 else 0,
+            'avg_commitments': round(row['total_commitments'] / company_count, 1) if company_count > 0 else 0,
+            'total_commitments': row['total_commitments'],
+            'active_commitments': row['active_commitments']
         })
 
     # Sort by company count
     data.sort(key=lambda x: x['company_count'], reverse=True)
 
-    return {"data": data}
+    response = {"data": data}
+    _cache_put('industries', response, 300)
+    return response
 
 
 @router.get("/compare", response_model=dict)
@@ -147,59 +125,33 @@ async def compare_companies(
     if len(ids) > 5:
         raise HTTPException(status_code=400, detail="Maximum 5 companies can be compared")
 
-    # Get companies
-    companies_result = supabase.table('companies').select('*').in_('id', ids).execute()
+    # compare_companies() (migrations/015) aggregates per company in
+    # SQL, so one RPC returns a metric row each instead of every raw
+    # source and commitment row
+    result = supabase.rpc('compare_companies', {'ids': ids}).execute()
 
-    if len(companies_result.data) != len(ids):
+    if len(result.data) != len(ids):
         raise HTTPException(status_code=404, detail="One or more companies not found")
 
-    # Get profiles
-    profiles_result = supabase.table('profiles').select('*').in_('company_id', ids).execute()
-    profile_by_company = {p['company_id']: p for p in profiles_result.data}
-
-    # Get sources and commitments for each profile
-    profile_ids = [p['id'] for p in profiles_result.data]
-
-    sources_result = supabase.table('data_sources').select('profile_id, reliability_score').in_('profile_id', profile_ids).execute()
-    commitments_result = supabase.table('commitments').select('profile_id, current_status, commitment_type').in_('profile_id', profile_ids).execute()
-
-    # Organize by profile
-    sources_by_profile = defaultdict(list)
-    commitments_by_profile = defaultdict(list)
-
-    for source in sources_result.data:
-        sources_by_profile[source['profile_id']].append(source)
-
-    for commitment in commitments_result.data:
-        commitments_by_profile[commitment['profile_id']].append(commitment)
-
-    # Build comparison
-    comparison_data = []
-    for company in companies_result.data:
-        company_id = company['id']
-        profile = profile_by_company.get(company_id, {})
-        profile_id = profile.get('id')
-
-        sources = sources_by_profile.get(profile_id, [])
-        commitments = commitments_by_profile.get(profile_id, [])
-
-        company_data = {
-            "id": company['id'],
-            "name": company['name'],
-            "ticker": company['ticker'],
-            "industry": company['industry'],
+    comparison_data = [
+        {
+            "id": row['id'],
+            "name": row['name'],
+            "ticker": row['ticker'],
+            "industry": row['industry'],
             "metrics": {
-                "source_count": len(sources),
-                "commitment_count": len(commitments),
-                "active_commitments": sum(1 for c in commitments if c.get('current_status') == 'active'),
-                "discontinued_commitments": sum(1 for c in commitments if c.get('current_status') == 'discontinued'),
-                "pledge_count": sum(1 for c in commitments if c.get('commitment_type') == 'pledge'),
-                "industry_initiatives": sum(1 for c in commitments if c.get('commitment_type') == 'industry_initiative'),
-                "avg_source_reliability": round(sum(s.get('reliability_score', 0) for s in sources) / len(sources), 2) if sources else 0,
-                "latest_research": profile.get('research_captured_at')
+                "source_count": row['source_count'],
+                "commitment_count": row['commitment_count'],
+                "active_commitments": row['active_commitments'],
+                "discontinued_commitments": row['discontinued_commitments'],
+                "pledge_count": row['pledge_count'],
+                "industry_initiatives": row['industry_initiatives'],
+                "avg_source_reliability": row['avg_source_reliability'],
+                "latest_research": row['latest_research']
             }
         }
-        comparison_data.append(company_data)
+        for row in result.data
+    ]
 
     return {"data": {"companies": comparison_data}}
 
@@ -212,55 +164,36 @@ async def get_stance_changes(
     """Track changes in DEI stances over time"""
     supabase = get_supabase_client()
 
-    # Get all commitments with status changes
-    query = supabase.table('commitments') \
-        .select('*, profiles(*, companies(*))') \
-        .not_.is_('previous_status', 'null')
+    # stance_changes_v (migrations/013) pre-joins companies, narrows the
+    # columns and classifies the direction; filter and sort server-side
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    query = supabase.table('stance_changes_v') \
+        .select('*') \
+        .gte('status_changed_at', cutoff) \
+        .order('status_changed_at', desc=True)
 
-    result = query.execute()
+    if change_type and change_type != 'all':
+        query = query.eq('change_direction', change_type)
 
-    changes = []
-    for commitment in result.data:
-        prev_status = commitment.get('previous_status')
-        curr_status = commitment.get('current_status')
-
-        # Determine change direction
-        if prev_status == 'active' and curr_status == 'discontinued':
-            direction = 'decreased'
-        elif prev_status == 'discontinued' and curr_status == 'active':
-            direction = 'increased'
-        else:
-            direction = 'changed'
-
-        # Apply filter
-        if change_type and change_type != 'all' and direction != change_type:
-            continue
-
-        # Get company info
-        company = None
-        if 'profiles' in commitment and commitment['profiles']:
-            profile = commitment['profiles'] if isinstance(commitment['profiles'], dict) else commitment['profiles'][0]
-            if 'companies' in profile and profile['companies']:
-                comp = profile['companies'] if isinstance(profile['companies'], dict) else profile['companies'][0]
-                company = {
-                    "id": comp.get("id"),
-                    "name": comp.get("name"),
-                    "ticker": comp.get("ticker"),
-                    "industry": comp.get("industry")
-                }
-
-        changes.append({
-            "commitment_name": commitment['commitment_name'],
-            "commitment_type": commitment['commitment_type'],
-            "previous_status": prev_status,
-            "current_status": curr_status,
-            "changed_at": commitment.get('status_changed_at'),
-            "change_direction": direction,
-            "company": company
-        })
+    result = query.execute()
 
-    # Sort by change date
-    changes.sort(key=lambda x: x.get('changed_at') or '', reverse=True)
+    changes = [
+        {
+            "commitment_name": row['commitment_name'],
+            "commitment_type": row['commitment_type'],
+            "previous_status": row['previous_status'],
+            "current_status": row['current_status'],
+            "changed_at": row['status_changed_at'],
+            "change_direction": row['change_direction'],
+            "company": {
+                "id": row['company_id'],
+                "name": row['name'],
+                "ticker": row['ticker'],
+                "industry": row['industry']
+            }
+        }
+        for row in result.data
+    ]
 
     # Stats
     total_changes = len(changes)
@@ -283,69 +216,37 @@ async def get_stance_changes(
 @router.get("/industry-trends", response_model=dict)
 async def get_industry_trends():
     """Analyze DEI trends by industry"""
+    cached = _cache_get('industry-trends')
+    if cached is not None:
+        return cached
+
     supabase = get_supabase_client()
 
-    # Get all commitments with company/industry info
-    result = supabase.table('commitments') \
-        .select('current_status, previous_status, profiles(*, companies(*))') \
+    # mv_industry_trends (migrations/017) holds the precomputed grouped
+    # aggregate, refreshed by pg_cron; a request is one indexed read
+    # instead of a commitments scan
+    result = supabase.table('mv_industry_trends') \
+        .select('*') \
+        .order('company_count', desc=True) \
         .execute()
 
-    industry_trends = defaultdict(lambda: {
-        'total_commitments': 0,
-        'active': 0,
-        'discontinued': 0,
-        'increased': 0,
-        'decreased': 0,
-        'companies': set()
-    })
-
-    for commitment in result.data:
-        # Get industry
-        industry = None
-        if 'profiles' in commitment and commitment['profiles']:
-            profile = commitment['profiles'] if isinstance(commitment['profiles'], dict) else commitment['profiles'][0]
-            if 'companies' in profile and profile['companies']:
-                company = profile['companies'] if isinstance(profile['companies'], dict) else profile['companies'][0]
-                industry = company.get('industry')
-                industry_trends[industry]['companies'].add(company.get('id'))
-
-        if not industry:
-            continue
-
-        trends = industry_trends[industry]
-        trends['total_commitments'] += 1
-
-        curr_status = commitment.get('current_status')
-        prev_status = commitment.get('previous_status')
-
-        if curr_status == 'active':
-            trends['active'] += 1
-        elif curr_status == 'discontinued':
-            trends['discontinued'] += 1
-
-        # Track changes
-        if prev_status:
-            if prev_status == 'discontinued' and curr_status == 'active':
-                trends['increased'] += 1
-            elif prev_status == 'active' and curr_status == 'discontinued':
-                trends['decreased'] += 1
-
     # Format response
     data = []
-    for industry, trends in industry_trends.items():
-        company_count = len(trends['companies'])
+    for row in result.data:
+        increased = row['recent_increases']
+        decreased = row['recent_decreases']
         data.append({
-            'industry': industry,
-            'company_count': company_count,
-            'total_commitments': trends['total_commitments'],
-            'active_commitments': trends['active'],
-            'discontinued_commitments': trends['discontinued'],
-            'recent_increases': trends['increased'],
-            'recent_decreases': trends['decreased'],
-            'net_trend': trends['increased'] - trends['decreased'],
-            'trend_direction': 'positive' if trends['increased'] > trends['decreased'] else 'negative' if trends['decreased'] > trends['increased'] else 'stable'
+            'industry': row['industry'],
+            'company_count': row['company_count'],
+            'total_commitments': row['total_commitments'],
+            'active_commitments': row['active_commitments'],
+            'discontinued_commitments': row['discontinued_commitments'],
+            'recent_increases': increased,
+            'recent_decreases': decreased,
+            'net_trend': increased - decreased,
+            'trend_direction': 'positive' if increased > decreased else 'negative' if decreased > increased else 'stable'
         })
 
-    data.sort(key=lambda x: x['company_count'], reverse=True)
-
-    return {"data": data}
+    response = {"data": data}
+    _cache_put('industry-trends', response, 300)
+    return response
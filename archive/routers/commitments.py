@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from database import get_supabase_client
 from schemas.commitment import CommitmentResponse
+from utils import unwrap_embed
 
 router = APIRouter(prefix="/commitments", tags=["commitments"])
 
@@ -20,56 +21,28 @@ async def list_commitments(
     supabase = get_supabase_client()
 
     offset = (page - 1) * per_page
-    query = supabase.table('commitments').select('*, profiles(*, companies(*))', count='exact')
-
-    if profile_id:
-        query = query.eq('profile_id', profile_id)
-    if commitment_type:
-        query = query.eq('commitment_type', commitment_type)
-    if status:
-        query = query.eq('current_status', status)
-    if search:
-        query = query.ilike('commitment_name', f'%{search}%')
-    if changed_only:
-        query = query.not_.is_('previous_status', 'null')
-
-    query = query.order('commitment_name')
-    query = query.range(offset, offset + per_page - 1)
-
-    result = query.execute()
-
-    total_count = result.count if result.count else 0
+    # list_commitments_paged() (migrations/024) applies every filter via
+    # named parameters and returns the page with its total count in one
+    # round trip, on a plan Postgres prepares once per session
+    result = supabase.rpc('list_commitments_paged', {
+        'p_profile_id': profile_id,
+        'p_type': commitment_type,
+        'p_status': status,
+        'p_search': search,
+        'p_changed_only': changed_only,
+        'p_limit': per_page,
+        'p_offset': offset
+    }).execute()
+
+    rows = result.data or []
+    total_count = rows[0]['total_count'] if rows else 0
     total_pages = (total_count + per_page - 1) // per_page if total_count > 0 else 0
 
-    # Transform data
-    commitments_data = []
-    for row in result.data:
-        commitment = {
-            "id": row["id"],
-            "profile_id": row["profile_id"],
-            "commitment_name": row["commitment_name"],
-            "commitment_type": row["commitment_type"],
-            "current_status": row["current_status"],
-            "quotes": row.get("quotes", []),
-            "provenance_ids": row.get("provenance_ids", []),
-            "status_changed_at": row.get("status_changed_at"),
-            "previous_status": row.get("previous_status"),
-            "quote_count": len(row.get("quotes", [])),
-            "source_count": len(row.get("provenance_ids", []))
-        }
-
-        # Add company info
-        if 'profiles' in row and row['profiles']:
-            profile = row['profiles'] if isinstance(row['profiles'], dict) else row['profiles'][0]
-            if 'companies' in profile and profile['companies']:
-                company = profile['companies'] if isinstance(profile['companies'], dict) else profile['companies'][0]
-                commitment['company'] = {
-                    "id": company.get("id"),
-                    "name": company.get("name"),
-                    "ticker": company.get("ticker")
-                }
-
-        commitments_data.append(commitment)
+    # Drop the window-aggregate column; rows otherwise match the response
+    commitments_data = [
+        {key: value for key, value in row.items() if key != 'total_count'}
+        for row in rows
+    ]
 
     return {
         "data": commitments_data,
@@ -87,36 +60,11 @@ async def get_commitment_types():
     """Get all commitment types with statistics"""
     supabase = get_supabase_client()
 
-    result = supabase.table('commitments').select('commitment_type, current_status, profile_id').execute()
-
-    # Calculate stats
-    type_stats = {}
-    for row in result.data:
-        commitment_type = row['commitment_type']
-        if commitment_type not in type_stats:
-            type_stats[commitment_type] = {
-                'count': 0,
-                'active_count': 0,
-                'profile_ids': set()
-            }
-        type_stats[commitment_type]['count'] += 1
-        if row['current_status'] == 'active':
-            type_stats[commitment_type]['active_count'] += 1
-        type_stats[commitment_type]['profile_ids'].add(row['profile_id'])
-
-    # Format response
-    data = []
-    for commitment_type, stats in type_stats.items():
-        data.append({
-            'commitment_type': commitment_type,
-            'count': stats['count'],
-            'active_count': stats['active_count'],
-            'companies_count': len(stats['profile_ids'])
-        })
-
-    data.sort(key=lambda x: x['count'], reverse=True)
+    # Grouped server-side by commitment_type_stats() (migrations/019),
+    # already sorted by count
+    result = supabase.rpc('commitment_type_stats').execute()
 
-    return {"data": data}
+    return {"data": result.data}
 
 
 @router.get("/changes", response_model=dict)
@@ -130,7 +78,12 @@ async def get_commitment_changes(
 
     offset = (page - 1) * per_page
     query = supabase.table('commitments') \
-        .select('*, profiles(*, companies(*))', count='exact') \
+        .select(
+            'id, commitment_name, commitment_type, previous_status, '
+            'current_status, status_changed_at, '
+            'profiles(id, companies(id, name, ticker))',
+            count='exact'
+        ) \
         .not_.is_('previous_status', 'null')
 
     # Filter by change type
@@ -161,10 +114,10 @@ async def get_commitment_changes(
         }
 
         # Add company info
-        if 'profiles' in row and row['profiles']:
-            profile = row['profiles'] if isinstance(row['profiles'], dict) else row['profiles'][0]
-            if 'companies' in profile and profile['companies']:
-                company = profile['companies'] if isinstance(profile['companies'], dict) else profile['companies'][0]
+        profile = unwrap_embed(row.get('profiles'))
+        if profile:
+            company = unwrap_embed(profile.get('companies'))
+            if company:
                 change['company'] = {
                     "id": company.get("id"),
                     "name": company.get("name"),
@@ -190,7 +143,11 @@ async def get_commitment(commitment_id: str):
     supabase = get_supabase_client()
 
     result = supabase.table('commitments') \
-        .select('*, profiles(*, companies(*))') \
+        .select(
+            'id, profile_id, commitment_name, commitment_type, '
+            'current_status, quotes, provenance_ids, status_changed_at, '
+            'previous_status, profiles(id, companies(id, name, ticker, industry))'
+        ) \
         .eq('id', commitment_id) \
         .execute()
 
@@ -212,10 +169,10 @@ async def get_commitment(commitment_id: str):
     }
 
     # Add company info
-    if 'profiles' in commitment_data and commitment_data['profiles']:
-        profile = commitment_data['profiles'] if isinstance(commitment_data['profiles'], dict) else commitment_data['profiles'][0]
-        if 'companies' in profile and profile['companies']:
-            company = profile['companies'] if isinstance(profile['companies'], dict) else profile['companies'][0]
+    profile = unwrap_embed(commitment_data.get('profiles'))
+    if profile:
+        company = unwrap_embed(profile.get('companies'))
+        if company:
             response['company'] = {
                 "id": company.get("id"),
                 "name": company.get("name"),
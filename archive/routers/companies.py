@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from typing import List, Optional
 from database import get_supabase_client
 from schemas.company import CompanyResponse, CompanyWithProfile
+from utils import unwrap_embed
 
 router = APIRouter(prefix="/companies", tags=["companies"])
 
@@ -49,11 +50,8 @@ async def list_companies(
     total_count = result.count if result.count else 0
     total_pages = (total_count + per_page - 1) // per_page if total_count > 0 else 0
 
-    # Transform data
-    companies = [CompanyResponse.from_db(row) for row in result.data]
-
     return {
-        "data": [c.model_dump() for c in companies],
+        "data": [CompanyResponse.from_db_dict(row) for row in result.data],
         "pagination": {
             "page": page,
             "per_page": per_page,
@@ -90,15 +88,12 @@ async def get_company(
         raise HTTPException(status_code=404, detail="Company not found")
 
     company_data = result.data[0]
-    company = CompanyResponse.from_db(company_data)
-
-    response = company.model_dump()
+    response = CompanyResponse.from_db_dict(company_data)
 
     # Add profile if included
-    if include and 'profile' in include and 'profiles' in company_data:
-        profiles = company_data.get('profiles', [])
-        if profiles:
-            profile = profiles[0] if isinstance(profiles, list) else profiles
+    if include and 'profile' in include:
+        profile = unwrap_embed(company_data.get('profiles'))
+        if profile:
             response['profile'] = {
                 'id': profile.get('id'),
                 'generated_at': profile.get('generated_at'),
@@ -126,15 +121,14 @@ async def get_company_by_ticker(ticker: str):
             detail=f"Company with ticker {ticker} not found"
         )
 
-    company = CompanyResponse.from_db(result.data[0])
-    return {"data": company.model_dump()}
+    return {"data": CompanyResponse.from_db_dict(result.data[0])}
 
 
 @router.get("/search/advanced", response_model=dict)
 async def advanced_search(
     q: Optional[str] = None,
-    industries: Optional[str] = Query(None, description="Comma-separated industries"),
-    countries: Optional[str] = Query(None, description="Comma-separated countries"),
+    industries: Optional[List[str]] = Query(None, description="Filter by multiple industries (repeat the parameter)"),
+    countries: Optional[List[str]] = Query(None, description="Filter by multiple countries (repeat the parameter)"),
     has_profile: Optional[bool] = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100)
@@ -151,13 +145,11 @@ async def advanced_search(
 
     # Multiple industries
     if industries:
-        industry_list = [i.strip() for i in industries.split(',')]
-        query = query.in_('industry', industry_list)
+        query = query.in_('industry', industries)
 
     # Multiple countries
     if countries:
-        country_list = [c.strip() for c in countries.split(',')]
-        query = query.in_('hq_country', country_list)
+        query = query.in_('hq_country', countries)
 
     query = query.range(offset, offset + per_page - 1)
     result = query.execute()
@@ -165,10 +157,8 @@ async def advanced_search(
     total_count = result.count if result.count else 0
     total_pages = (total_count + per_page - 1) // per_page if total_count > 0 else 0
 
-    companies = [CompanyResponse.from_db(row) for row in result.data]
-
     return {
-        "data": [c.model_dump() for c in companies],
+        "data": [CompanyResponse.from_db_dict(row) for row in result.data],
         "pagination": {
             "page": page,
             "per_page": per_page,
@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from database import get_supabase_client
 from schemas.profile import ProfileResponse
+from utils import unwrap_embed
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
@@ -17,7 +19,12 @@ async def list_profiles(
     supabase = get_supabase_client()
 
     offset = (page - 1) * per_page
-    query = supabase.table('profiles').select('*, companies(id, name, ticker)', count='exact')
+    query = supabase.table('profiles').select(
+        'id, company_id, schema_version, profile_type, generated_at, '
+        'research_captured_at, source_count, is_latest, created_at, '
+        'companies(id, name, ticker)',
+        count='exact'
+    )
 
     if company_id:
         query = query.eq('company_id', company_id)
@@ -48,8 +55,8 @@ async def list_profiles(
         }
 
         # Add company info if available
-        if 'companies' in row and row['companies']:
-            company = row['companies'] if isinstance(row['companies'], dict) else row['companies'][0]
+        company = unwrap_embed(row.get('companies'))
+        if company:
             profile['company'] = {
                 "id": company.get("id"),
                 "name": company.get("name"),
@@ -77,11 +84,33 @@ async def get_profile(
     """Get detailed DEI profile"""
     supabase = get_supabase_client()
 
-    # Get profile with company
-    result = supabase.table('profiles') \
-        .select('*, companies(*)') \
-        .eq('id', profile_id) \
-        .execute()
+    include_sources = bool(include and 'sources' in include)
+    include_commitments = bool(include and 'commitments' in include)
+
+    # The profile and the include queries only need the URL's
+    # profile_id, so fire them all concurrently instead of serially
+    queries = [
+        supabase.table('profiles')
+        .select(
+            'id, company_id, schema_version, profile_type, generated_at, '
+            'research_captured_at, research_notes, source_count, is_latest, '
+            'created_at, companies(id, name, ticker, industry)'
+        )
+        .eq('id', profile_id)
+    ]
+    if include_sources:
+        queries.append(
+            supabase.table('data_sources').select('*').eq('profile_id', profile_id)
+        )
+    if include_commitments:
+        queries.append(
+            supabase.table('commitments').select('*').eq('profile_id', profile_id)
+        )
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(query.execute) for query in queries)
+    )
+    result = results[0]
 
     if not result.data:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -102,8 +131,8 @@ async def get_profile(
     }
 
     # Add company
-    if 'companies' in profile_data and profile_data['companies']:
-        company = profile_data['companies'] if isinstance(profile_data['companies'], dict) else profile_data['companies'][0]
+    company = unwrap_embed(profile_data.get('companies'))
+    if company:
         response['company'] = {
             "id": company.get("id"),
             "name": company.get("name"),
@@ -111,20 +140,11 @@ async def get_profile(
             "industry": company.get("industry")
         }
 
-    # Include sources if requested
-    if include and 'sources' in include:
-        sources_result = supabase.table('data_sources') \
-            .select('*') \
-            .eq('profile_id', profile_id) \
-            .execute()
-        response['sources'] = sources_result.data
-
-    # Include commitments if requested
-    if include and 'commitments' in include:
-        commitments_result = supabase.table('commitments') \
-            .select('*') \
-            .eq('profile_id', profile_id) \
-            .execute()
-        response['commitments'] = commitments_result.data
+    # Attach the include results in the order they were queued
+    extras = iter(results[1:])
+    if include_sources:
+        response['sources'] = next(extras).data
+    if include_commitments:
+        response['commitments'] = next(extras).data
 
     return {"data": response}
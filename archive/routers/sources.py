@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 from database import get_supabase_client
 from schemas.source import SourceResponse
+from utils import unwrap_embed
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
@@ -57,34 +58,11 @@ async def get_source_types():
     """Get all source types with statistics"""
     supabase = get_supabase_client()
 
-    # Get all sources
-    result = supabase.table('data_sources').select('source_type, reliability_score').execute()
-
-    # Calculate stats
-    type_stats = {}
-    for row in result.data:
-        source_type = row['source_type']
-        if source_type not in type_stats:
-            type_stats[source_type] = {
-                'count': 0,
-                'total_reliability': 0
-            }
-        type_stats[source_type]['count'] += 1
-        type_stats[source_type]['total_reliability'] += row['reliability_score']
-
-    # Format response
-    data = []
-    for source_type, stats in type_stats.items():
-        data.append({
-            'source_type': source_type,
-            'count': stats['count'],
-            'avg_reliability': round(stats['total_reliability'] / stats['count'], 2)
-        })
-
-    # Sort by count
-    data.sort(key=lambda x: x['count'], reverse=True)
+    # Grouped server-side by source_type_stats() (migrations/019),
+    # already sorted by count
+    result = supabase.rpc('source_type_stats').execute()
 
-    return {"data": data}
+    return {"data": result.data}
 
 
 @router.get("/{source_id}", response_model=dict)
@@ -93,7 +71,11 @@ async def get_source(source_id: str):
     supabase = get_supabase_client()
 
     result = supabase.table('data_sources') \
-        .select('*, profiles(*, companies(*))') \
+        .select(
+            'id, profile_id, source_id, source_type, publisher, author, '
+            'url, date, title, reliability_score, doc_type, notes, '
+            'profiles(id, companies(id, name, ticker))'
+        ) \
         .eq('id', source_id) \
         .execute()
 
@@ -118,10 +100,10 @@ async def get_source(source_id: str):
     }
 
     # Add company info if available
-    if 'profiles' in source_data and source_data['profiles']:
-        profile = source_data['profiles'] if isinstance(source_data['profiles'], dict) else source_data['profiles'][0]
-        if 'companies' in profile and profile['companies']:
-            company = profile['companies'] if isinstance(profile['companies'], dict) else profile['companies'][0]
+    profile = unwrap_embed(source_data.get('profiles'))
+    if profile:
+        company = unwrap_embed(profile.get('companies'))
+        if company:
             response['company'] = {
                 "id": company.get("id"),
                 "name": company.get("name"),
@@ -47,6 +47,30 @@ class CompanyResponse(BaseModel):
             updated_at=data["updated_at"]
         )
 
+    @staticmethod
+    def from_db_dict(data: dict) -> dict:
+        """Reshape a database row straight into the response dict.
+
+        The row only needs its hq_* fields nested under headquarters;
+        building a BaseModel and immediately model_dump()-ing it walked
+        every field twice per row for that one reshape. Outbound rows
+        come from the database schema, so validation adds nothing here.
+        """
+        return {
+            "id": data["id"],
+            "ticker": data["ticker"],
+            "name": data["name"],
+            "cik": data.get("cik"),
+            "industry": data["industry"],
+            "headquarters": {
+                "city": data["hq_city"],
+                "state": data.get("hq_state"),
+                "country": data["hq_country"]
+            },
+            "created_at": data["created_at"],
+            "updated_at": data["updated_at"]
+        }
+
 
 class CompanyWithProfile(CompanyResponse):
     profile_id: Optional[str] = None
@@ -0,0 +1,11 @@
+def unwrap_embed(value):
+    """Normalize a PostgREST embedded resource to a single dict.
+
+    Depending on how the relationship was detected, PostgREST returns a
+    to-one embed either as a dict or as a one-element list; callers just
+    want the row (or None). Defined once here instead of the
+    isinstance branch every router used to repeat per row.
+    """
+    if isinstance(value, dict):
+        return value
+    return value[0] if value else None
@@ -0,0 +1,53 @@
+-- Precompute commitment/controversy/event counts on profiles
+--
+-- Keeps per-profile child counts maintained by triggers so list endpoints
+-- can render counts without joining or fetching child rows, and the full
+-- profile endpoint can read them straight off the profile row.
+
+ALTER TABLE profiles
+ADD COLUMN IF NOT EXISTS commitment_count integer NOT NULL DEFAULT 0 CHECK (commitment_count >= 0),
+ADD COLUMN IF NOT EXISTS controversy_count integer NOT NULL DEFAULT 0 CHECK (controversy_count >= 0),
+ADD COLUMN IF NOT EXISTS event_count integer NOT NULL DEFAULT 0 CHECK (event_count >= 0);
+
+COMMENT ON COLUMN profiles.commitment_count IS 'Trigger-maintained count of commitments for this profile';
+COMMENT ON COLUMN profiles.controversy_count IS 'Trigger-maintained count of controversies for this profile';
+COMMENT ON COLUMN profiles.event_count IS 'Trigger-maintained count of events for this profile';
+
+-- Backfill from existing child rows
+UPDATE profiles p SET
+  commitment_count = (SELECT COUNT(*) FROM commitments c WHERE c.profile_id = p.id),
+  controversy_count = (SELECT COUNT(*) FROM controversies c WHERE c.profile_id = p.id),
+  event_count = (SELECT COUNT(*) FROM events e WHERE e.profile_id = p.id);
+
+-- Generic trigger function: increments/decrements the named counter column
+CREATE OR REPLACE FUNCTION bump_profile_child_count() RETURNS trigger AS $$
+DECLARE
+  counter text := TG_ARGV[0];
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    EXECUTE format('UPDATE profiles SET %I = %I + 1 WHERE id = $1', counter, counter)
+      USING NEW.profile_id;
+    RETURN NEW;
+  ELSIF TG_OP = 'DELETE' THEN
+    EXECUTE format('UPDATE profiles SET %I = %I - 1 WHERE id = $1', counter, counter)
+      USING OLD.profile_id;
+    RETURN OLD;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS commitments_count_trigger ON commitments;
+CREATE TRIGGER commitments_count_trigger
+  AFTER INSERT OR DELETE ON commitments
+  FOR EACH ROW EXECUTE FUNCTION bump_profile_child_count('commitment_count');
+
+DROP TRIGGER IF EXISTS controversies_count_trigger ON controversies;
+CREATE TRIGGER controversies_count_trigger
+  AFTER INSERT OR DELETE ON controversies
+  FOR EACH ROW EXECUTE FUNCTION bump_profile_child_count('controversy_count');
+
+DROP TRIGGER IF EXISTS events_count_trigger ON events;
+CREATE TRIGGER events_count_trigger
+  AFTER INSERT OR DELETE ON events
+  FOR EACH ROW EXECUTE FUNCTION bump_profile_child_count('event_count');
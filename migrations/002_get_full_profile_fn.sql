@@ -0,0 +1,132 @@
+-- Single-query full-profile assembly
+--
+-- Collapses the full-profile component fan-out into one JSONB-returning
+-- function, so the endpoint pays a single round trip and Postgres builds
+-- the nested payload with one plan.
+
+CREATE OR REPLACE FUNCTION get_full_profile(_pid uuid) RETURNS jsonb
+LANGUAGE sql STABLE AS $$
+SELECT jsonb_build_object(
+    'id', p.id,
+    'company_id', p.company_id,
+    'schema_version', p.schema_version,
+    'profile_type', p.profile_type,
+    'generated_at', p.generated_at,
+    'research_captured_at', p.research_captured_at,
+    'research_notes', p.research_notes,
+    'source_count', p.source_count,
+    'commitment_count', p.commitment_count,
+    'controversy_count', p.controversy_count,
+    'event_count', p.event_count,
+    'is_latest', p.is_latest,
+    'created_at', p.created_at,
+    'company', jsonb_build_object(
+        'id', c.id, 'name', c.name, 'ticker', c.ticker,
+        'industry', c.industry, 'hq_city', c.hq_city,
+        'hq_state', c.hq_state, 'hq_country', c.hq_country
+    ),
+    'key_insights', COALESCE((
+        SELECT jsonb_agg(to_jsonb(x) ORDER BY x.insight_order)
+        FROM ai_key_insights x WHERE x.profile_id = _pid
+    ), '[]'::jsonb),
+    'strategic_implications', COALESCE((
+        SELECT jsonb_agg(to_jsonb(x) ORDER BY x.implication_order)
+        FROM ai_strategic_implications x WHERE x.profile_id = _pid
+    ), '[]'::jsonb),
+    'commitments', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object(
+            'id', cm.id,
+            'commitment_name', cm.commitment_name,
+            'commitment_type', cm.commitment_type,
+            'current_status', cm.current_status,
+            'quotes', cm.quotes,
+            'sources', COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', ds.id, 'source_id', ds.source_id,
+                    'source_type', ds.source_type, 'title', ds.title,
+                    'url', ds.url, 'date', ds.date,
+                    'reliability_score', ds.reliability_score
+                ))
+                FROM commitment_sources cs
+                JOIN data_sources ds ON ds.id = cs.source_id
+                WHERE cs.commitment_id = cm.id
+            ), '[]'::jsonb)
+        ))
+        FROM commitments cm WHERE cm.profile_id = _pid
+    ), '[]'::jsonb),
+    'controversies', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object(
+            'id', cv.id,
+            'type', cv.type,
+            'status', cv.status,
+            'description', cv.description,
+            'date', cv.date,
+            'case_name', cv.case_name,
+            'quotes', cv.quotes,
+            'sources', COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', ds.id, 'source_id', ds.source_id,
+                    'source_type', ds.source_type, 'title', ds.title,
+                    'url', ds.url, 'date', ds.date,
+                    'reliability_score', ds.reliability_score
+                ))
+                FROM controversy_sources cs
+                JOIN data_sources ds ON ds.id = cs.source_id
+                WHERE cs.controversy_id = cv.id
+            ), '[]'::jsonb)
+        ))
+        FROM controversies cv WHERE cv.profile_id = _pid
+    ), '[]'::jsonb),
+    'events', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object(
+            'id', ev.id,
+            'date', ev.date,
+            'event_type', ev.event_type,
+            'headline', ev.headline,
+            'sentiment', ev.sentiment,
+            'impact', ev.impact,
+            'impact_magnitude', ev.impact_magnitude,
+            'impact_direction', ev.impact_direction,
+            'event_category', ev.event_category,
+            'summary', ev.summary,
+            'quotes', ev.quotes,
+            'sources', COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', ds.id, 'source_id', ds.source_id,
+                    'source_type', ds.source_type, 'title', ds.title,
+                    'url', ds.url, 'date', ds.date,
+                    'reliability_score', ds.reliability_score
+                ))
+                FROM event_sources es
+                JOIN data_sources ds ON ds.id = es.source_id
+                WHERE es.event_id = ev.id
+            ), '[]'::jsonb)
+        ))
+        FROM events ev WHERE ev.profile_id = _pid
+    ), '[]'::jsonb),
+    'sources', COALESCE((
+        SELECT jsonb_agg(jsonb_build_object(
+            'id', ds.id, 'source_id', ds.source_id, 'source_type', ds.source_type,
+            'title', ds.title, 'url', ds.url, 'date', ds.date,
+            'reliability_score', ds.reliability_score, 'notes', ds.notes,
+            'summary', ds.notes, 'publisher', ds.publisher, 'author', ds.author,
+            'doc_type', ds.doc_type
+        ) ORDER BY ds.date DESC NULLS LAST)
+        FROM data_sources ds WHERE ds.profile_id = _pid
+    ), '[]'::jsonb)
+)
+-- One-row components are appended null-stripped so absent components stay
+-- out of the payload, matching the previous response shape
+|| jsonb_strip_nulls(jsonb_build_object(
+    'ai_context', (SELECT to_jsonb(x) FROM ai_contexts x WHERE x.profile_id = _pid),
+    'dei_posture', (SELECT to_jsonb(x) FROM dei_postures x WHERE x.profile_id = _pid),
+    'cdo_role', (SELECT to_jsonb(x) FROM cdo_roles x WHERE x.profile_id = _pid),
+    'reporting_practices', (SELECT to_jsonb(x) FROM reporting_practices x WHERE x.profile_id = _pid),
+    'supplier_diversity', (SELECT to_jsonb(x) FROM supplier_diversity x WHERE x.profile_id = _pid),
+    'risk_assessment', (SELECT to_jsonb(x) FROM risk_assessments x WHERE x.profile_id = _pid),
+    'data_quality_flags', (SELECT to_jsonb(x) FROM data_quality_flags x WHERE x.profile_id = _pid)
+))
+FROM profiles p
+JOIN companies c ON c.id = p.company_id
+WHERE p.id = _pid;
+$$;
@@ -0,0 +1,29 @@
+-- Aggregate supplier diversity stats in the database
+--
+-- Replaces the fetch-every-row + Python sum()/len() approach in
+-- /supplier-diversity/stats/overview with one aggregate query that
+-- returns a single row.
+
+CREATE OR REPLACE FUNCTION supplier_diversity_stats()
+RETURNS TABLE (
+  total bigint,
+  programs_exist bigint,
+  spending_disclosed bigint,
+  status_breakdown jsonb
+)
+LANGUAGE sql STABLE AS $$
+SELECT
+  COUNT(*) AS total,
+  COUNT(*) FILTER (WHERE program_exists) AS programs_exist,
+  COUNT(*) FILTER (WHERE spending_disclosed) AS spending_disclosed,
+  COALESCE((
+    SELECT jsonb_object_agg(program_status, c)
+    FROM (
+      SELECT program_status, COUNT(*) AS c
+      FROM supplier_diversity
+      WHERE program_status IS NOT NULL
+      GROUP BY program_status
+    ) s
+  ), '{}'::jsonb) AS status_breakdown
+FROM supplier_diversity;
+$$;
@@ -0,0 +1,21 @@
+-- Materialize the supplier diversity stats
+--
+-- The platform-wide aggregates change on the order of hours, so they are
+-- precomputed into a single-row materialized view and refreshed on a
+-- schedule instead of being recomputed on every request.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS supplier_diversity_stats_mv AS
+SELECT * FROM supplier_diversity_stats();
+
+-- Unique index on a constant expression so the one-row view supports
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS supplier_diversity_stats_mv_one_row
+  ON supplier_diversity_stats_mv ((1));
+
+-- Refresh every 10 minutes (requires the pg_cron extension, enabled by
+-- default on Supabase projects)
+SELECT cron.schedule(
+  'refresh_supplier_diversity_stats_mv',
+  '*/10 * * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY supplier_diversity_stats_mv'
+);
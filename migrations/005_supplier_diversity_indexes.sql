@@ -0,0 +1,17 @@
+-- Indexes for the list_supplier_diversity filter predicates
+--
+-- All list filters are equality predicates (program_status,
+-- program_exists, spending_disclosed, profile_id) but had no tailored
+-- index, so filtered pagination fell back to sequential scans. The
+-- covering index lets the common filter combinations resolve as index
+-- range scans, with INCLUDE columns avoiding heap fetches for the
+-- selected payload fields.
+
+CREATE INDEX IF NOT EXISTS idx_supplier_diversity_filters
+  ON supplier_diversity (program_status, program_exists, spending_disclosed, profile_id)
+  INCLUDE (quotes, provenance_ids, created_at, updated_at);
+
+-- Accelerates the profiles.company_id equality filter used by the
+-- nested company join
+CREATE INDEX IF NOT EXISTS idx_profiles_company_id
+  ON profiles (company_id);
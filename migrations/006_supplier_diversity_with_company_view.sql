@@ -0,0 +1,17 @@
+-- Expose supplier diversity rows pre-joined with their company
+--
+-- Replaces the nested profiles!inner(companies!inner(...)) PostgREST
+-- embedding with an explicit join view whose rows already match the API
+-- response shape, so handlers no longer unwrap embedded resources in
+-- Python.
+
+CREATE OR REPLACE VIEW supplier_diversity_with_company AS
+SELECT
+  sd.*,
+  p.company_id,
+  jsonb_build_object(
+    'id', c.id, 'name', c.name, 'ticker', c.ticker, 'industry', c.industry
+  ) AS company
+FROM supplier_diversity sd
+JOIN profiles p ON p.id = sd.profile_id
+JOIN companies c ON c.id = p.company_id;
@@ -0,0 +1,8 @@
+-- Composite index for keyset pagination on supplier diversity
+--
+-- list_supplier_diversity orders by (created_at, profile_id) and seeks
+-- from an (after_created_at, after_id) cursor; this index turns every
+-- page into a bounded index range scan regardless of depth.
+
+CREATE INDEX IF NOT EXISTS idx_supplier_diversity_keyset
+  ON supplier_diversity (created_at, profile_id);
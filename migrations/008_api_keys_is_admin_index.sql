@@ -0,0 +1,8 @@
+-- Partial index for admin-key existence checks
+--
+-- create_admin_key counts rows WHERE is_admin = true before inserting;
+-- the partial index answers that from the index alone.
+
+CREATE INDEX IF NOT EXISTS idx_api_keys_is_admin
+  ON api_keys (is_admin)
+  WHERE is_admin = true;
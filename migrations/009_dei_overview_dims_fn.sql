@@ -0,0 +1,16 @@
+-- Distinct industry/country counts for the analytics overview
+--
+-- The overview endpoints pulled every company row into Python just to
+-- take len(set(...)) twice. This function returns both cardinalities
+-- from a single scan, callable through PostgREST RPC.
+
+CREATE OR REPLACE FUNCTION dei_overview_dims()
+RETURNS TABLE(industries int, countries int)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    count(DISTINCT industry)::int,
+    count(DISTINCT hq_country)::int
+  FROM companies;
+$$;
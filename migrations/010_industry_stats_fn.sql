@@ -0,0 +1,45 @@
+-- Per-industry aggregates for /analytics/industries
+--
+-- The handler shipped every company, latest profile, commitment and
+-- controversy row to Python and rebuilt the join with dicts. This
+-- function does the JOIN and GROUP BY where the data lives and returns
+-- one row per industry. Totals come from the trigger-maintained counter
+-- columns on profiles (migrations/001), so no fan-out join is needed.
+
+CREATE OR REPLACE FUNCTION industry_stats()
+RETURNS TABLE(
+  industry text,
+  company_count bigint,
+  total_sources bigint,
+  total_commitments bigint,
+  active_commitments bigint,
+  total_controversies bigint,
+  companies_with_cdo bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    COALESCE(c.industry, 'Unknown'),
+    count(*),
+    COALESCE(sum(lp.source_count), 0),
+    COALESCE(sum(lp.commitment_count), 0),
+    COALESCE(sum(lp.active_commitments), 0),
+    COALESCE(sum(lp.controversy_count), 0),
+    count(*) FILTER (WHERE lp.has_cdo)
+  FROM companies c
+  LEFT JOIN LATERAL (
+    SELECT
+      p.source_count,
+      p.commitment_count,
+      p.controversy_count,
+      (SELECT count(*) FROM commitments cm
+        WHERE cm.profile_id = p.id AND cm.current_status = 'active') AS active_commitments,
+      EXISTS (SELECT 1 FROM cdo_roles cd
+        WHERE cd.profile_id = p.id AND cd.exists) AS has_cdo
+    FROM profiles p
+    WHERE p.company_id = c.id AND p.is_latest
+    LIMIT 1
+  ) lp ON true
+  GROUP BY COALESCE(c.industry, 'Unknown')
+$$;
@@ -0,0 +1,18 @@
+-- Authoritative table listing for the discovery scripts
+--
+-- The archived discovery scripts guessed ~200 candidate table names and
+-- probed each one over HTTPS. The catalog already knows the answer:
+-- one query over pg_class returns every public table plus the planner's
+-- cached row estimate, with no per-table scans.
+
+CREATE OR REPLACE FUNCTION list_public_tables()
+RETURNS TABLE(table_name text, row_estimate bigint)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT relname, reltuples::bigint
+  FROM pg_class
+  WHERE relnamespace = 'public'::regnamespace
+    AND relkind = 'r'
+  ORDER BY relname;
+$$;
@@ -0,0 +1,17 @@
+-- Column listing for the profiles table
+--
+-- deep_schema_check.py tested candidate column names one probe query at
+-- a time. information_schema.columns answers definitively in a single
+-- round-trip, so the script can intersect its candidate list locally.
+
+CREATE OR REPLACE FUNCTION profile_columns()
+RETURNS SETOF text
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT column_name::text
+  FROM information_schema.columns
+  WHERE table_schema = 'public'
+    AND table_name = 'profiles'
+  ORDER BY ordinal_position;
+$$;
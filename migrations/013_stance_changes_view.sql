@@ -0,0 +1,34 @@
+-- Pre-joined stance changes for /analytics/stance-changes
+--
+-- The handler fetched every changed commitment with nested
+-- profiles(*, companies(*)) embeds and classified the change direction
+-- in Python, ignoring its own `days` parameter. This view does the
+-- join, narrows to the columns the response uses, and classifies the
+-- direction in SQL so the handler can filter and sort server-side.
+
+CREATE OR REPLACE VIEW stance_changes_v AS
+SELECT
+  cm.commitment_name,
+  cm.commitment_type,
+  cm.previous_status,
+  cm.current_status,
+  cm.status_changed_at,
+  CASE
+    WHEN cm.previous_status = 'active' AND cm.current_status = 'discontinued' THEN 'decreased'
+    WHEN cm.previous_status = 'discontinued' AND cm.current_status = 'active' THEN 'increased'
+    ELSE 'changed'
+  END AS change_direction,
+  c.id AS company_id,
+  c.name,
+  c.ticker,
+  c.industry
+FROM commitments cm
+JOIN profiles p ON p.id = cm.profile_id
+JOIN companies c ON c.id = p.company_id
+WHERE cm.previous_status IS NOT NULL;
+
+-- Serves the view's cutoff filter and descending sort; partial so the
+-- unchanged majority of commitments stays out of the index
+CREATE INDEX IF NOT EXISTS idx_commitments_status_changed
+  ON commitments (status_changed_at DESC)
+  WHERE previous_status IS NOT NULL;
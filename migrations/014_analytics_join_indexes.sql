@@ -0,0 +1,16 @@
+-- Join-key indexes for the analytics endpoints
+--
+-- compare_companies and the industry aggregates filter data_sources and
+-- commitments by profile_id (IN lists) and commitments by
+-- current_status; without indexes each of those is a sequential scan.
+-- profiles(company_id) is already covered by migrations/005 and the
+-- partial status_changed_at index by migrations/013.
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_profile_id
+  ON data_sources (profile_id);
+
+CREATE INDEX IF NOT EXISTS idx_commitments_profile_id
+  ON commitments (profile_id);
+
+CREATE INDEX IF NOT EXISTS idx_commitments_current_status
+  ON commitments (current_status);
@@ -0,0 +1,64 @@
+-- Per-company comparison metrics for /analytics/compare
+--
+-- Even with the embedded select, the compare handler shipped every raw
+-- source and commitment row for the selected companies just to compute
+-- a handful of counts and one average. This function aggregates per
+-- company where the rows live and returns one metric row each.
+
+CREATE OR REPLACE FUNCTION compare_companies(ids uuid[])
+RETURNS TABLE(
+  id uuid,
+  name text,
+  ticker text,
+  industry text,
+  source_count bigint,
+  commitment_count bigint,
+  active_commitments bigint,
+  discontinued_commitments bigint,
+  pledge_count bigint,
+  industry_initiatives bigint,
+  avg_source_reliability numeric,
+  latest_research timestamptz
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    c.id,
+    c.name,
+    c.ticker::text,
+    c.industry::text,
+    COALESCE(src.source_count, 0),
+    COALESCE(cm.commitment_count, 0),
+    COALESCE(cm.active_commitments, 0),
+    COALESCE(cm.discontinued_commitments, 0),
+    COALESCE(cm.pledge_count, 0),
+    COALESCE(cm.industry_initiatives, 0),
+    COALESCE(src.avg_source_reliability, 0),
+    lp.research_captured_at
+  FROM companies c
+  LEFT JOIN LATERAL (
+    SELECT p.id, p.research_captured_at
+    FROM profiles p
+    WHERE p.company_id = c.id AND p.is_latest
+    LIMIT 1
+  ) lp ON true
+  LEFT JOIN LATERAL (
+    SELECT
+      count(*) AS source_count,
+      round(avg(ds.reliability_score), 2) AS avg_source_reliability
+    FROM data_sources ds
+    WHERE ds.profile_id = lp.id
+  ) src ON true
+  LEFT JOIN LATERAL (
+    SELECT
+      count(*) AS commitment_count,
+      count(*) FILTER (WHERE co.current_status = 'active') AS active_commitments,
+      count(*) FILTER (WHERE co.current_status = 'discontinued') AS discontinued_commitments,
+      count(*) FILTER (WHERE co.commitment_type = 'pledge') AS pledge_count,
+      count(*) FILTER (WHERE co.commitment_type = 'industry_initiative') AS industry_initiatives
+    FROM commitments co
+    WHERE co.profile_id = lp.id
+  ) cm ON true
+  WHERE c.id = ANY(ids)
+$$;
@@ -0,0 +1,34 @@
+-- Per-industry commitment trends for /analytics/industry-trends
+--
+-- The handler fetched every commitment with nested company embeds and
+-- reduced them in Python, holding a set of company UUIDs per industry
+-- just to take its length. One grouped pass with count(DISTINCT c.id)
+-- and FILTER counts returns a row per industry instead.
+
+CREATE OR REPLACE FUNCTION industry_trends()
+RETURNS TABLE(
+  industry text,
+  company_count bigint,
+  total_commitments bigint,
+  active_commitments bigint,
+  discontinued_commitments bigint,
+  recent_increases bigint,
+  recent_decreases bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    c.industry::text,
+    count(DISTINCT c.id),
+    count(*),
+    count(*) FILTER (WHERE cm.current_status = 'active'),
+    count(*) FILTER (WHERE cm.current_status = 'discontinued'),
+    count(*) FILTER (WHERE cm.previous_status = 'discontinued' AND cm.current_status = 'active'),
+    count(*) FILTER (WHERE cm.previous_status = 'active' AND cm.current_status = 'discontinued')
+  FROM commitments cm
+  JOIN profiles p ON p.id = cm.profile_id
+  JOIN companies c ON c.id = p.company_id
+  WHERE c.industry IS NOT NULL
+  GROUP BY c.industry
+$$;
@@ -0,0 +1,20 @@
+-- Materialize the per-industry commitment trends
+--
+-- The trends aggregate scans every commitment joined to companies and
+-- changes only when profiles are re-researched, so it is precomputed
+-- from industry_trends() (migrations/016) and refreshed on a schedule.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_industry_trends AS
+SELECT * FROM industry_trends();
+
+-- Unique key so the view supports REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS mv_industry_trends_industry
+  ON mv_industry_trends (industry);
+
+-- Refresh every 15 minutes (requires the pg_cron extension, enabled by
+-- default on Supabase projects)
+SELECT cron.schedule(
+  'refresh_mv_industry_trends',
+  '*/15 * * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_industry_trends'
+);
@@ -0,0 +1,32 @@
+-- Source-type and commitment-status breakdowns for the overview
+--
+-- Both overview endpoints fetched every data_sources and commitments
+-- row (one column each) and tallied the breakdowns in Python. This
+-- function groups server-side and returns the totals plus the two
+-- breakdowns as ready-made jsonb objects, so O(K) grouped values cross
+-- the wire instead of O(N) rows.
+
+CREATE OR REPLACE FUNCTION overview_breakdowns()
+RETURNS TABLE(
+  total_sources bigint,
+  total_commitments bigint,
+  source_types jsonb,
+  commitment_statuses jsonb
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    (SELECT count(*) FROM data_sources),
+    (SELECT count(*) FROM commitments),
+    (SELECT COALESCE(jsonb_object_agg(source_type, n), '{}'::jsonb)
+       FROM (SELECT source_type::text, count(*) AS n
+               FROM data_sources
+              WHERE source_type IS NOT NULL
+              GROUP BY source_type) s),
+    (SELECT COALESCE(jsonb_object_agg(current_status, n), '{}'::jsonb)
+       FROM (SELECT current_status::text, count(*) AS n
+               FROM commitments
+              WHERE current_status IS NOT NULL
+              GROUP BY current_status) s)
+$$;
@@ -0,0 +1,46 @@
+-- Grouped type statistics for /commitments/types/stats and
+-- /sources/types/stats
+--
+-- Both handlers fetched every row of their table and reduced counts,
+-- distinct companies and reliability averages in Python. One GROUP BY
+-- per table returns a row per type instead, so the payload is O(types)
+-- rather than O(rows).
+
+CREATE OR REPLACE FUNCTION commitment_type_stats()
+RETURNS TABLE(
+  commitment_type text,
+  count bigint,
+  active_count bigint,
+  companies_count bigint
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    cm.commitment_type::text,
+    count(*),
+    count(*) FILTER (WHERE cm.current_status = 'active'),
+    count(DISTINCT p.company_id)
+  FROM commitments cm
+  JOIN profiles p ON p.id = cm.profile_id
+  GROUP BY cm.commitment_type
+  ORDER BY count(*) DESC
+$$;
+
+CREATE OR REPLACE FUNCTION source_type_stats()
+RETURNS TABLE(
+  source_type text,
+  count bigint,
+  avg_reliability numeric
+)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT
+    source_type::text,
+    count(*),
+    round(avg(reliability_score), 2)
+  FROM data_sources
+  GROUP BY source_type
+  ORDER BY count(*) DESC
+$$;
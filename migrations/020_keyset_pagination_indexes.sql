@@ -0,0 +1,19 @@
+-- Composite indexes backing keyset (cursor) pagination
+--
+-- The list endpoints accept after_* cursor parameters and turn every
+-- page into an index range scan from the cursor position, instead of
+-- OFFSET scanning and discarding all preceding rows. Each index matches
+-- an endpoint's (sort column, id tiebreaker) pair; the data_sources
+-- index is scanned backward for that endpoint's date-descending order.
+
+CREATE INDEX IF NOT EXISTS idx_commitments_name_id
+  ON commitments (commitment_name, id);
+
+CREATE INDEX IF NOT EXISTS idx_companies_name_id
+  ON companies (name, id);
+
+CREATE INDEX IF NOT EXISTS idx_profiles_created_at_id
+  ON profiles (created_at, id);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_date_id
+  ON data_sources (date, id);
@@ -0,0 +1,14 @@
+-- Generated count columns for commitments
+--
+-- The commitments list only needs how many quotes and provenance
+-- sources each row has, yet computing those lengths in Python meant
+-- shipping the full quotes jsonb array and provenance_ids array over
+-- the wire for every row. Stored generated columns keep the counts
+-- maintained by Postgres so list selects can skip the arrays entirely;
+-- the detail endpoints still fetch the arrays themselves.
+
+ALTER TABLE commitments
+  ADD COLUMN IF NOT EXISTS quote_count int
+    GENERATED ALWAYS AS (coalesce(jsonb_array_length(quotes), 0)) STORED,
+  ADD COLUMN IF NOT EXISTS source_count int
+    GENERATED ALWAYS AS (coalesce(array_length(provenance_ids, 1), 0)) STORED;
@@ -0,0 +1,24 @@
+-- Filter/sort indexes for the list endpoints
+--
+-- Matches the predicates the list endpoints actually issue so their
+-- pages come from index range scans instead of a seq scan plus sort:
+-- commitments filter on type/status and sort on commitment_name;
+-- companies filter on industry (and location) and sort on name;
+-- data_sources filter on source_type and sort on date.
+--
+-- Already covered elsewhere: the partial status_changed_at index for
+-- changed-commitment queries (migrations/013), single-column
+-- profile_id/current_status indexes (migrations/014), and the keyset
+-- cursor indexes (migrations/020).
+
+CREATE INDEX IF NOT EXISTS idx_commitments_type_status_name
+  ON commitments (commitment_type, current_status, commitment_name);
+
+CREATE INDEX IF NOT EXISTS idx_companies_industry_name
+  ON companies (industry, name);
+
+CREATE INDEX IF NOT EXISTS idx_companies_country_state
+  ON companies (hq_country, hq_state);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_type_date
+  ON data_sources (source_type, date);
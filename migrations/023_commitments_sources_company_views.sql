@@ -0,0 +1,30 @@
+-- Expose commitments and data sources pre-joined with their company
+--
+-- Same shape as supplier_diversity_with_company (migrations/006): the
+-- list endpoints only embed profiles!inner(companies!inner(...)) to
+-- show a few company columns, paying PostgREST's two-hop embed
+-- resolution and a Python unwrap per row. These views carry the
+-- company object (and a flat company_id for filtering) directly, so
+-- handlers read single-relation rows that already match the response.
+
+CREATE OR REPLACE VIEW commitments_with_company AS
+SELECT
+  cm.*,
+  p.company_id,
+  jsonb_build_object(
+    'id', c.id, 'name', c.name, 'ticker', c.ticker, 'industry', c.industry
+  ) AS company
+FROM commitments cm
+JOIN profiles p ON p.id = cm.profile_id
+JOIN companies c ON c.id = p.company_id;
+
+CREATE OR REPLACE VIEW data_sources_with_company AS
+SELECT
+  ds.*,
+  p.company_id,
+  jsonb_build_object(
+    'id', c.id, 'name', c.name, 'ticker', c.ticker, 'industry', c.industry
+  ) AS company
+FROM data_sources ds
+JOIN profiles p ON p.id = ds.profile_id
+JOIN companies c ON c.id = p.company_id;
@@ -0,0 +1,58 @@
+-- One-shot paged commitment listing with named filter parameters
+--
+-- The archived commitments list built its PostgREST filter chain
+-- conditionally per request, so every call re-parsed a different URL
+-- query. This function takes every filter as a named parameter with a
+-- (param IS NULL OR ...) predicate, so Postgres prepares the plan once
+-- per session and the page plus its total count (window aggregate)
+-- arrive in a single round trip.
+
+CREATE OR REPLACE FUNCTION list_commitments_paged(
+  p_profile_id uuid DEFAULT NULL,
+  p_type text DEFAULT NULL,
+  p_status text DEFAULT NULL,
+  p_search text DEFAULT NULL,
+  p_changed_only boolean DEFAULT false,
+  p_limit int DEFAULT 20,
+  p_offset int DEFAULT 0
+)
+RETURNS TABLE (
+  id uuid,
+  profile_id uuid,
+  commitment_name text,
+  commitment_type text,
+  current_status text,
+  status_changed_at timestamptz,
+  previous_status text,
+  quote_count int,
+  source_count int,
+  company jsonb,
+  total_count bigint
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT
+    cm.id,
+    cm.profile_id,
+    cm.commitment_name,
+    cm.commitment_type::text,
+    cm.current_status::text,
+    cm.status_changed_at,
+    cm.previous_status::text,
+    cm.quote_count,
+    cm.source_count,
+    jsonb_build_object(
+      'id', c.id, 'name', c.name, 'ticker', c.ticker
+    ) AS company,
+    count(*) OVER () AS total_count
+  FROM commitments cm
+  JOIN profiles p ON p.id = cm.profile_id
+  JOIN companies c ON c.id = p.company_id
+  WHERE (p_profile_id IS NULL OR cm.profile_id = p_profile_id)
+    AND (p_type IS NULL OR cm.commitment_type::text = p_type)
+    AND (p_status IS NULL OR cm.current_status::text = p_status)
+    AND (p_search IS NULL OR cm.commitment_name ILIKE '%' || p_search || '%')
+    AND (NOT p_changed_only OR cm.previous_status IS NOT NULL)
+  ORDER BY cm.commitment_name
+  LIMIT p_limit OFFSET p_offset;
+$$;
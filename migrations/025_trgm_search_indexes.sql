@@ -0,0 +1,37 @@
+-- Trigram indexes for the unanchored ILIKE searches
+--
+-- Every search parameter in the API issues ILIKE '%term%', which a
+-- btree cannot serve, so each search was a sequential scan with a
+-- row-level filter. pg_trgm GIN indexes make those predicates
+-- index-assisted with no handler changes: the planner picks them up
+-- for the existing ILIKE queries automatically.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_commitments_name_trgm
+  ON commitments USING gin (commitment_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_companies_name_trgm
+  ON companies USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_companies_ticker_trgm
+  ON companies USING gin (ticker gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_title_trgm
+  ON data_sources USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_notes_trgm
+  ON data_sources USING gin (notes gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_data_sources_publisher_trgm
+  ON data_sources USING gin (publisher gin_trgm_ops);
+
+-- Searched by the events and controversies lists
+CREATE INDEX IF NOT EXISTS idx_events_headline_trgm
+  ON events USING gin (headline gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_events_summary_trgm
+  ON events USING gin (summary gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_controversies_description_trgm
+  ON controversies USING gin (description gin_trgm_ops);
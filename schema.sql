@@ -217,6 +217,9 @@ CREATE TABLE public.profiles (
   research_captured_at timestamp with time zone,
   research_notes text,
   source_count integer NOT NULL DEFAULT 0 CHECK (source_count >= 0),
+  commitment_count integer NOT NULL DEFAULT 0 CHECK (commitment_count >= 0),
+  controversy_count integer NOT NULL DEFAULT 0 CHECK (controversy_count >= 0),
+  event_count integer NOT NULL DEFAULT 0 CHECK (event_count >= 0),
   is_latest boolean NOT NULL DEFAULT true,
   created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
   updated_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,